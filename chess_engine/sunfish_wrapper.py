@@ -1,11 +1,109 @@
 import chess
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+import math
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import List, Dict, Optional, Hashable, Tuple
 
 
-@dataclass
+# Score sign per color, indexed by chess.BLACK (False) / chess.WHITE (True)
+COLOR_SIGN = (-1, 1)
+
+# Piece values in centipawns, indexed by piece type (index 0 is unused)
+PIECE_VALUES = (0, 100, 320, 330, 500, 900, 20000)  # King is high to detect mate
+
+# Center squares for control evaluation
+CENTER_BB = chess.BB_D4 | chess.BB_E4 | chess.BB_D5 | chess.BB_E5
+EXTENDED_CENTER_BB = (chess.BB_RANK_3 | chess.BB_RANK_4 | chess.BB_RANK_5 | chess.BB_RANK_6) & \
+                     (chess.BB_FILE_C | chess.BB_FILE_D | chess.BB_FILE_E | chess.BB_FILE_F)
+OUTER_CENTER_BB = EXTENDED_CENTER_BB & ~CENTER_BB
+
+
+def _build_passed_pawn_masks() -> List[List[int]]:
+    """Build the squares that must be free of enemy pawns for a pawn to be passed
+    
+    Indexed as [color][square]: the pawn's own and adjacent files, on every
+    rank ahead of the pawn from that color's point of view.
+    """
+    masks = [[0] * 64, [0] * 64]
+    for square in chess.SQUARES:
+        file, rank = chess.square_file(square), chess.square_rank(square)
+        files = chess.BB_FILES[file]
+        if file > 0:
+            files |= chess.BB_FILES[file - 1]
+        if file < 7:
+            files |= chess.BB_FILES[file + 1]
+        masks[chess.WHITE][square] = files & ~((1 << ((rank + 1) * 8)) - 1) & chess.BB_ALL
+        masks[chess.BLACK][square] = files & ((1 << (rank * 8)) - 1)
+    return masks
+
+
+PASSED_PAWN_MASKS = _build_passed_pawn_masks()
+
+
+def _build_king_safety_zones() -> List[List[tuple]]:
+    """Build the (castled side, bonus) king safety entry for each color and square
+    
+    Castled squares (g/h and a/b/c files on the home rank) are tagged with the
+    side whose castling rights earn the bonus; kings on the d and e files get
+    the center penalty.
+    """
+    zones = [[(None, 0)] * 64, [(None, 0)] * 64]
+    for color, home_rank in ((chess.WHITE, 0), (chess.BLACK, 7)):
+        for square in chess.SQUARES:
+            file, rank = chess.square_file(square), chess.square_rank(square)
+            if rank == home_rank and file >= 6:    # g1, h1 / g8, h8
+                zones[color][square] = ('K', 100)
+            elif rank == home_rank and file <= 2:  # a1, b1, c1 / a8, b8, c8
+                zones[color][square] = ('Q', 100)
+            elif file in (3, 4):                   # d and e files
+                zones[color][square] = (None, -50)
+    return zones
+
+
+KING_SAFETY_ZONES = _build_king_safety_zones()
+
+# Number of squares attacked by a non-sliding piece on each square, which
+# doesn't depend on the rest of the board (pawns indexed as [color][square])
+PAWN_MOBILITY = tuple(tuple(attacks.bit_count() for attacks in pawn_attacks)
+                      for pawn_attacks in chess.BB_PAWN_ATTACKS)
+KNIGHT_MOBILITY = tuple(attacks.bit_count() for attacks in chess.BB_KNIGHT_ATTACKS)
+KING_MOBILITY = tuple(attacks.bit_count() for attacks in chess.BB_KING_ATTACKS)
+
+
+def _count_material(board: chess.Board) -> int:
+    """Material balance in centipawns (White minus Black), one popcount per piece type and color"""
+    white = board.occupied_co[chess.WHITE]
+    black = board.occupied_co[chess.BLACK]
+    material = 0
+    for piece_type, piece_bb in ((chess.PAWN, board.pawns), (chess.KNIGHT, board.knights),
+                                 (chess.BISHOP, board.bishops), (chess.ROOK, board.rooks),
+                                 (chess.QUEEN, board.queens), (chess.KING, board.kings)):
+        material += PIECE_VALUES[piece_type] * ((piece_bb & white).bit_count() - (piece_bb & black).bit_count())
+    return material
+
+
+def _material_delta(board: chess.Board, move: chess.Move) -> int:
+    """Change in material balance (White minus Black) from making move on board"""
+    if not move:  # Null move
+        return 0
+    gain = 0
+    if board.is_en_passant(move):
+        gain = PIECE_VALUES[chess.PAWN]
+    else:
+        captured = board.piece_type_at(move.to_square)
+        if captured and board.color_at(move.to_square) != board.turn:
+            gain = PIECE_VALUES[captured]
+    if move.promotion:
+        gain += PIECE_VALUES[move.promotion] - PIECE_VALUES[chess.PAWN]
+    return gain * COLOR_SIGN[board.turn]
+
+
+@dataclass(slots=True, frozen=True)
 class EngineAnalysis:
-    """Analysis results from the engine"""
+    """Analysis results from the engine
+    
+    Frozen, since evaluate_position hands the same cached instance to every caller.
+    """
     score: float                 # Total evaluation score
     material_balance: float = 0  # Pure material score
     positional_score: float = 0  # Position quality score
@@ -13,11 +111,7 @@ class EngineAnalysis:
     center_control: float = 0    # Control of central squares
     king_safety: float = 0       # King safety evaluation
     depth: int = 1               # Search depth (1 for static evaluation)
-    pv: List[str] = None         # Principal variation (planned moves)
-    
-    def __post_init__(self):
-        if self.pv is None:
-            self.pv = []
+    pv: Tuple[str, ...] = ()     # Principal variation (planned moves)
 
     def __str__(self):
         """Human readable analysis"""
@@ -29,7 +123,7 @@ class EngineAnalysis:
                 f"King Safety: {self.king_safety:.2f})")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveContext:
     """Detailed chess context for a move"""
     is_capture: bool
@@ -48,19 +142,57 @@ class MoveContext:
 
 class ChessEngine:
     """Simple chess engine wrapper using python-chess"""
+
+    # Transposition table shared by every engine instance (one per piece agent),
+    # mapping a position's Zobrist-style key to its static evaluation
+    EVAL_CACHE_SIZE = 1 << 16
+    _eval_cache: 'OrderedDict[Hashable, EngineAnalysis]' = OrderedDict()
+    
+    # Attack masks of every occupied square, per position, for the move context checks
+    ATTACK_CACHE_SIZE = 1 << 12
+    _attack_cache: 'OrderedDict[Hashable, Dict[chess.Square, int]]' = OrderedDict()
+    
+    # Boards parsed from FEN strings - agents set up the same position over and
+    # over, and copying a parsed board is far cheaper than parsing the FEN again
+    POSITION_CACHE_SIZE = 1 << 10
+    _position_cache: 'OrderedDict[str, chess.Board]' = OrderedDict()
     
-    def __init__(self):
-        self._board = chess.Board()
+    def __init__(self, board: Optional[chess.Board] = None):
+        """Create an engine at the starting position, or at a copy of the given board"""
+        if board is None:
+            self._board = chess.Board()
+            self._material = 0  # Kept in step with self._board by set_position/make_move
+        else:
+            self._board = board.copy(stack=False)
+            self._material = _count_material(self._board)
     
     def set_position(self, fen: str = None, moves: list = None):
         """Set the current position"""
         if fen: # If we get a FEN string, use it directly
-            self._board = chess.Board(fen)
+            board = self._position_cache.get(fen)
+            if board is None:
+                board = chess.Board(fen)
+                self._position_cache[fen] = board
+                if len(self._position_cache) > self.POSITION_CACHE_SIZE:
+                    self._position_cache.popitem(last=False)  # Evict least recently used
+            else:
+                self._position_cache.move_to_end(fen)
+            self._board = board.copy(stack=False)
         else: # Otherwise, we assume a starting position and need to make moves
             self._board = chess.Board()
             if moves:
                 for move in moves:
                     self._board.push(chess.Move.from_uci(move))
+        self._material = _count_material(self._board)
+    
+    def set_board(self, board: chess.Board):
+        """Set the current position from an existing board
+        
+        The board is copied without its move stack, so moves made through the
+        engine never touch the caller's board.
+        """
+        self._board = board.copy(stack=False)
+        self._material = _count_material(self._board)
                 
     def get_legal_moves(self) -> List[str]:
         """Get list of legal moves in UCI format"""
@@ -68,80 +200,157 @@ class ChessEngine:
     
     def make_move(self, move: str):
         """Make a move on the board"""
-        self._board.push(chess.Move.from_uci(move))
+        move = chess.Move.from_uci(move)
+        self._material += _material_delta(self._board, move)
+        self._board.push(move)
+        
+    def evaluate_position(self, quiescence_depth: int = 0) -> EngineAnalysis:
+        """Sophisticated static position evaluation
+        
+        Args:
+            quiescence_depth: Plies of captures to resolve with a quiescence
+                search before scoring. The total score then comes from the
+                search, and its depth is reported as 1 + quiescence_depth; the
+                component scores stay static. 0 keeps the plain static evaluation
+        """
+        analysis = self._cached_evaluation()
+        if quiescence_depth > 0:
+            # Search scores are from the side to move's point of view
+            sign = COLOR_SIGN[self._board.turn]
+            score = self._quiescence(-math.inf, math.inf, quiescence_depth) * sign
+            analysis = replace(analysis, score=score, depth=1 + quiescence_depth)
+        return analysis
+    
+    def _cached_evaluation(self) -> EngineAnalysis:
+        """Static evaluation of the current board
+        
+        Results are memoized in a transposition table keyed on the board's
+        transposition key (placement, turn, castling rights and en passant),
+        so transposed or repeated positions skip the evaluation entirely.
+        """
+        key = self._board._transposition_key()
+        cached = self._eval_cache.get(key)
+        if cached is not None:
+            self._eval_cache.move_to_end(key)
+            return cached
+        
+        analysis = self._evaluate_board()
+        self._eval_cache[key] = analysis
+        if len(self._eval_cache) > self.EVAL_CACHE_SIZE:
+            self._eval_cache.popitem(last=False)  # Evict least recently used
+        return analysis
+    
+    def _quiescence(self, alpha: float, beta: float, depth: int) -> float:
+        """Negamax alpha-beta over captures only, scored for the side to move
+        
+        The static evaluation is the stand-pat score, so a side is never forced
+        into a losing capture. Captures are tried most valuable victim first,
+        least valuable attacker first, which is what lets the beta cutoffs prune.
+        """
+        board = self._board
+        stand_pat = self._cached_evaluation().score * COLOR_SIGN[board.turn]
+        if depth <= 0 or stand_pat >= beta:
+            return stand_pat
+        alpha = max(alpha, stand_pat)
+        
+        captures = sorted(
+            board.generate_legal_captures(),
+            key=lambda move: (PIECE_VALUES[board.piece_type_at(move.to_square) or chess.PAWN] -
+                              PIECE_VALUES[board.piece_type_at(move.from_square)]),
+            reverse=True)
+        material = self._material
+        for move in captures:
+            self._material = material + _material_delta(board, move)
+            board.push(move)
+            try:
+                score = -self._quiescence(-beta, -alpha, depth - 1)
+            finally:
+                board.pop()
+                self._material = material
+            if score >= beta:
+                return beta
+            alpha = max(alpha, score)
+        return alpha
+    
+    def evaluate_positions(self, candidate_moves: List[str]) -> List[EngineAnalysis]:
+        """Evaluate the positions reached by each candidate move from the current one
+        
+        Each move is pushed, evaluated and popped on the same board, so scoring N
+        candidates costs no position setup and shares the transposition table.
+        
+        Args:
+            candidate_moves: Moves in UCI format, all legal in the current position
+            
+        Returns:
+            One EngineAnalysis per move, in the same order
+        """
+        analyses = []
+        material = self._material
+        for move in candidate_moves:
+            move = chess.Move.from_uci(move)
+            self._material = material + _material_delta(self._board, move)
+            self._board.push(move)
+            try:
+                analyses.append(self._cached_evaluation())
+            finally:
+                self._board.pop()
+                self._material = material
+        return analyses
+    
+    def _evaluate_board(self) -> EngineAnalysis:
+        """Evaluate the current board from scratch (uncached)"""
+        # Bind the board's bitboards and lookup tables to locals once - the loop
+        # below is dominated by attribute and global lookups
+        board = self._board
+        occupied_co = board.occupied_co
+        color_sign = COLOR_SIGN
+        passed_pawn_masks = PASSED_PAWN_MASKS
+        
+        # Material is kept up to date incrementally by make_move
+        material = self._material
         
-    def evaluate_position(self) -> EngineAnalysis:
-        """Sophisticated static position evaluation"""
-        # Initialize component scores
-        material = 0
+        # Initialize remaining component scores
         positional = 0
         mobility = 0
         center = 0
         king_safety = 0
+        middlegame = board.occupied.bit_count() > 20
         
-        # More accurate piece values (in centipawns)
-        piece_values = {
-            chess.PAWN: 100,
-            chess.KNIGHT: 320,
-            chess.BISHOP: 330,
-            chess.ROOK: 500,
-            chess.QUEEN: 900,
-            chess.KING: 20000  # High value to detect mate
-        }
-        
-        # Center squares for control evaluation
-        center_squares = {chess.E4, chess.E5, chess.D4, chess.D5}
-        extended_center = {
-            chess.C3, chess.D3, chess.E3, chess.F3,
-            chess.C4, chess.D4, chess.E4, chess.F4,
-            chess.C5, chess.D5, chess.E5, chess.F5,
-            chess.C6, chess.D6, chess.E6, chess.F6
-        }
-        
-        # Calculate material and basic positional scores
-        for square, piece in self._board.piece_map().items():
-            value = piece_values[piece.piece_type]
-            multiplier = 1 if piece.color == chess.WHITE else -1
+        # Walk each color's piece bitboards directly instead of building
+        # piece_map() and a Piece object per square. Mobility is counted in the
+        # same pass: attack counts of pawns, knights and kings come from
+        # precomputed tables, only sliders need the board's attack masks
+        attacks_mask = board.attacks_mask
+        sliders = board.bishops | board.rooks | board.queens
+        for color in chess.COLORS:
+            multiplier = color_sign[color]
+            own = occupied_co[color]
+            enemy_pawns = board.pawns & occupied_co[not color]
+            pawn_mobility = PAWN_MOBILITY[color]
+            attacks = 0
             
-            # Material score
-            material += value * multiplier
+            # Center control bonus, weighted popcounts of the center masks
+            center += (30 * (own & CENTER_BB).bit_count() +
+                       15 * (own & OUTER_CENTER_BB).bit_count()) * multiplier
+            
+            # Potential center control for pawns that can move to center, from
+            # the squares in front of them
+            own_pawns = board.pawns & own
+            pawn_fronts = own_pawns << 8 if color == chess.WHITE else own_pawns >> 8
+            center += (10 * (pawn_fronts & CENTER_BB).bit_count() +
+                       5 * (pawn_fronts & OUTER_CENTER_BB).bit_count()) * multiplier
             
-            # Center control bonus
-            if square in center_squares:
-                center += 30 * multiplier  # Major bonus for center control
-            elif square in extended_center:
-                center += 15 * multiplier  # Minor bonus for extended center
-                
-            # Add potential center control for pawns that can move to center
-            if piece.piece_type == chess.PAWN:
-                # Get the square in front of the pawn
-                next_square = square + 8 if piece.color == chess.WHITE else square - 8
-                if 0 <= next_square < 64:  # Check if square is on board
-                    if next_square in center_squares:
-                        center += 10 * multiplier  # Bonus for potential center control
-                    elif next_square in extended_center:
-                        center += 5 * multiplier   # Minor bonus for potential extended center
-
             # Positional bonuses
-            if piece.piece_type == chess.PAWN:
-                # Passed pawn bonus - using bitwise operations
-                file_mask = chess.BB_FILES[chess.square_file(square)]
-                pawns_on_file = self._board.pawns & file_mask
-                # A passed pawn has no opposing pawns ahead of it on the same file
-                if piece.color == chess.WHITE:
-                    # For white pawns, check squares above
-                    ahead_mask = file_mask & ((1 << square) - 1)  # All squares above current square
-                    if not (pawns_on_file & ahead_mask & self._board.occupied_co[chess.BLACK]):
-                        positional += 50 * multiplier
-                else:
-                    # For black pawns, check squares below
-                    ahead_mask = file_mask & ~((1 << (square + 1)) - 1)  # All squares below current square
-                    if not (pawns_on_file & ahead_mask & self._board.occupied_co[chess.WHITE]):
-                        positional += 50 * multiplier
+            for square in chess.scan_forward(own_pawns):
+                attacks += pawn_mobility[square]
+                
+                # Passed pawn bonus - no enemy pawns ahead on this or adjacent files
+                if not (enemy_pawns & passed_pawn_masks[color][square]):
+                    positional += 50 * multiplier
 
                 # Advanced pawn bonus
-                rank = chess.square_rank(square)
-                if piece.color == chess.WHITE:
+                rank = square >> 3
+                if color == chess.WHITE:
                     # Bonus only for advancing beyond rank 2
                     if rank > 1:  # pawns start on rank 2
                         positional += (rank - 1) * 10 * multiplier
@@ -150,46 +359,32 @@ class ChessEngine:
                     if rank < 6:  # pawns start on rank 7
                         positional += (6 - rank) * 10 * multiplier
 
-            elif piece.piece_type == chess.BISHOP:
-                # Bishop pair bonus
-                if len([p for p in self._board.pieces(chess.BISHOP, piece.color)]) == 2:
-                    positional += 50 * multiplier
+            for square in chess.scan_forward(board.knights & own):
+                attacks += KNIGHT_MOBILITY[square]
+            for square in chess.scan_forward(sliders & own):
+                attacks += attacks_mask(square).bit_count()
+
+            # Bishop pair bonus, 50 for each of the two bishops
+            if (board.bishops & own).bit_count() == 2:
+                positional += 100 * multiplier
 
-            elif piece.piece_type == chess.KING:
+            for square in chess.scan_forward(board.kings & own):
+                attacks += KING_MOBILITY[square]
+                
                 # King safety evaluation
-                if len(self._board.piece_map()) > 20:  # Middlegame
-                    rank = chess.square_rank(square)
-                    file = chess.square_file(square)
-                    
-                    # Define safe squares after castling
-                    white_kingside_castle = (rank == 0 and file >= 6)  # g1, h1
-                    white_queenside_castle = (rank == 0 and file <= 2)  # a1, b1, c1
-                    black_kingside_castle = (rank == 7 and file >= 6)  # g8, h8
-                    black_queenside_castle = (rank == 7 and file <= 2)  # a8, b8, c8
+                if middlegame:
+                    side, bonus = KING_SAFETY_ZONES[color][square]
                     
                     # Award points for proper castling positions
-                    if piece.color == chess.WHITE:
-                        if white_kingside_castle and self._board.has_kingside_castling_rights(chess.WHITE):
-                            king_safety += 100
-                        elif white_queenside_castle and self._board.has_queenside_castling_rights(chess.WHITE):
-                            king_safety += 100
-                    else:  # Black
-                        if black_kingside_castle and self._board.has_kingside_castling_rights(chess.BLACK):
-                            king_safety += 100
-                        elif black_queenside_castle and self._board.has_queenside_castling_rights(chess.BLACK):
-                            king_safety += 100
-                    
-                    # Penalize kings in the center
-                    center_files = [3, 4]  # d and e files
-                    if file in center_files:
-                        king_safety -= 50 * multiplier
-        
-        # Mobility evaluation
-        for square in chess.SQUARES:
-            piece = self._board.piece_at(square)
-            if piece:
-                mobility_value = len(self._board.attacks(square))
-                mobility += mobility_value * (1 if piece.color == chess.WHITE else -1)
+                    if side == 'K' and board.has_kingside_castling_rights(color):
+                        king_safety += bonus
+                    elif side == 'Q' and board.has_queenside_castling_rights(color):
+                        king_safety += bonus
+                    elif bonus < 0:
+                        # Penalize kings in the center
+                        king_safety += bonus * multiplier
+            
+            mobility += attacks * multiplier
         
         # Normalize mobility score
         mobility = mobility * 0.1
@@ -238,64 +433,56 @@ class ChessEngine:
         """Get current side to move (True for white, False for black)"""
         return self._board.turn
     
-    def parse_square(self, square: str) -> chess.Square:
-        """Parse a square from a string"""
-        return chess.parse_square(square)
-    
-    def square_file(self, square: chess.Square) -> int:
-        """Get the file index of a square"""
-        return chess.square_file(square)
-    
-    def square_rank(self, square: chess.Square) -> int:
-        """Get the rank index of a square"""
-        return chess.square_rank(square)
+    # Square helpers are python-chess's own functions, bound without a wrapper frame
+    parse_square = staticmethod(chess.parse_square)  # Parse a square from a string
+    square_file = staticmethod(chess.square_file)    # Get the file index of a square
+    square_rank = staticmethod(chess.square_rank)    # Get the rank index of a square
+    square = staticmethod(chess.square)              # Get the square at given file and rank
     
     def get_potential_attacks(self, square: chess.Square) -> chess.SquareSet:
         """Get all squares that could be attacked by piece at given square, regardless of legality.
         This includes squares occupied by friendly pieces and moves that might not be legal due to pins or checks."""
         return self._board.attacks(square)
 
-    def square(self, file: int, rank: int) -> chess.Square:
-        """Get the square at given file and rank"""
-        return chess.square(file, rank)
-
     def analyze_move_context(self, move: str) -> MoveContext:
         """Analyze chess-specific implications of a move"""
-        # Parse move
-        source_square = move[:2]
-        target_square = move[2:4]
-        promotion_piece = move[4] if len(move) > 4 else None
-
-        # Store current position
-        before = self._board.copy()
+        # Parse move - the Move already holds both squares as integers
         chess_move = chess.Move.from_uci(move)
+        from_square = chess_move.from_square
+        to_square = chess_move.to_square
         
-        # Get piece info before move
-        piece = before.piece_at(chess.parse_square(source_square))
-        captured = before.piece_at(chess.parse_square(target_square))
+        # Get piece and move info before the move - the board itself still
+        # holds the original position, so there is no need to copy it
+        piece = self._board.piece_at(from_square)
+        captured = self._board.piece_at(to_square)
+        is_capture = self._board.is_capture(chess_move)
+        is_castle = self._board.is_castling(chess_move)
+        is_en_passant = self._board.is_en_passant(chess_move)
+        gives_discovered_attack = self._check_discovered_attacks(self._board, chess_move)
+        is_blocking = self._check_blocked_attacks(self._board, chess_move)
         
         # Make move to analyze resulting position
         self._board.push(chess_move)
+        is_check = self._board.is_check()
+        
+        # Restore position
+        self._board.pop()
         
-        context = MoveContext(
-            is_capture=before.is_capture(chess_move),
-            is_check=self._board.is_check(),
-            is_castle=before.is_castling(chess_move),
+        return MoveContext(
+            is_capture=is_capture,
+            is_check=is_check,
+            is_castle=is_castle,
             piece_type=piece.symbol() if piece else '',
             captured_piece_type=captured.symbol() if captured else None,
-            source_square=source_square,
-            target_square=target_square,
+            source_square=chess.square_name(from_square),
+            target_square=chess.square_name(to_square),
             is_promotion=chess_move.promotion is not None,
             promotion_piece_type=chess.piece_name(chess_move.promotion) if chess_move.promotion else None,
-            is_en_passant=before.is_en_passant(chess_move),
-            gives_discovered_attack=self._check_discovered_attacks(before, chess_move),
-            is_blocking=self._check_blocked_attacks(before, chess_move)
+            is_en_passant=is_en_passant,
+            gives_discovered_attack=gives_discovered_attack,
+            is_blocking=is_blocking
         )
         
-        # Restore position
-        self._board.pop()
-        return context
-        
     def _check_discovered_attacks(self, position: chess.Board, move: chess.Move) -> bool:
         """Check if move reveals any discovered attacks
         
@@ -303,41 +490,40 @@ class ChessEngine:
         from a different piece that was previously blocked.
         """
         from_square = move.from_square
-        to_square = move.to_square
         
-        # Get all our pieces except the one that's moving
-        our_pieces = {
-            square: piece for square, piece in position.piece_map().items()
-            if piece.color == position.turn and square != from_square
-        }
+        # Our pieces except the one that's moving, and all enemy pieces, read
+        # straight from the color bitboards rather than rebuilding piece_map()
+        our_pieces = position.occupied_co[position.turn] & ~chess.BB_SQUARES[from_square]
+        enemy_occupied = position.occupied_co[not position.turn]
         
-        # Get all enemy pieces
-        enemy_pieces = {
-            square: piece for square, piece in position.piece_map().items()
-            if piece.color != position.turn
-        }
+        # Besides the from-square, en passant also vacates the captured pawn's square
+        is_en_passant = position.is_en_passant(move)
         
-        # For each of our pieces, check if it gains new attacks after the move
-        for our_square, our_piece in our_pieces.items():
-            # Skip non-sliding pieces (only sliding pieces can have discovered attacks)
-            if our_piece.piece_type not in [chess.BISHOP, chess.ROOK, chess.QUEEN]:
-                continue
-                
-            # Get attacked squares before the move
-            before_squares = chess.SquareSet(position.attacks(our_square))
-            
-            # Make the move and get new attacked squares
-            position.push(move)
-            after_squares = chess.SquareSet(position.attacks(our_square))
-            position.pop()
-            
-            # Find newly attacked squares
-            new_squares = after_squares - before_squares
+        # Collect our sliding pieces (only sliding pieces can have discovered
+        # attacks) that could gain an attack, with their pre-move attacks
+        before_masks = self._attack_masks(position)
+        candidates = []
+        for our_square in chess.scan_forward(our_pieces & (position.bishops | position.rooks | position.queens)):
+            before_mask = before_masks[our_square]
             
-            # Check if any enemy pieces are in newly attacked squares
-            for enemy_square in enemy_pieces:
-                if enemy_square in new_squares:
+            # Only a slider attacking the vacated square, with an enemy piece
+            # somewhere on that line, can gain an attack on it
+            if is_en_passant or (
+                    before_mask & chess.BB_SQUARES[from_square] and
+                    chess.BB_RAYS[our_square][from_square] & enemy_occupied):
+                candidates.append((our_square, before_mask))
+        
+        if not candidates:
+            return False
+        
+        # Make the move once and compare each candidate's new attacks
+        position.push(move)
+        try:
+            for our_square, before_mask in candidates:
+                if position.attacks_mask(our_square) & ~before_mask & enemy_occupied:
                     return True
+        finally:
+            position.pop()
                     
         return False
 
@@ -347,37 +533,55 @@ class ChessEngine:
         This is similar to discovered attacks but from the enemy's perspective - 
         we check if any enemy pieces lose attacks after our move.
         """
-        to_square = move.to_square
+        enemy_occupied = position.occupied_co[not position.turn]
+        enemy_sliders = enemy_occupied & (position.bishops | position.rooks | position.queens)
+        occupied_before = position.occupied
+        before_masks = self._attack_masks(position)
         
-        # Get all enemy pieces
-        enemy_pieces = {
-            square: piece for square, piece in position.piece_map().items()
-            if piece.color != position.turn
-        }
-        
-        # For each enemy piece, check if it loses attacks after our move
-        for enemy_square, enemy_piece in enemy_pieces.items():
-            # Get attacked squares before the move
-            before_squares = chess.SquareSet(position.attacks(enemy_square))
+        position.push(move)
+        try:
+            # Only captured pieces, or sliders whose attacks run into a newly
+            # occupied square, can lose attacks - other pieces' attacks don't
+            # depend on occupancy
+            captured = enemy_occupied & ~position.occupied_co[position.turn]
+            newly_occupied = position.occupied & ~occupied_before
+            candidates = captured
+            for enemy_square in chess.scan_forward(enemy_sliders & ~captured):
+                if before_masks[enemy_square] & newly_occupied:
+                    candidates |= chess.BB_SQUARES[enemy_square]
             
-            # Make the move and get new attacked squares
-            position.push(move)
-            after_squares = chess.SquareSet(position.attacks(enemy_square))
+            # For each candidate, check if it loses attacks after our move
+            # (a captured piece's square now holds our piece, or nothing)
+            for enemy_square in chess.scan_forward(candidates):
+                if before_masks[enemy_square] & ~position.attacks_mask(enemy_square):
+                    return True
+        finally:
             position.pop()
-            
-            # Find lost attack squares
-            lost_squares = before_squares - after_squares
-            
-            # If any attacks were lost, this move is blocking
-            if lost_squares:
-                return True
                     
         return False
 
+    def _attack_masks(self, position: chess.Board) -> Dict[chess.Square, int]:
+        """Get the attack mask of every occupied square, memoized per position
+        
+        Keyed on the transposition key, so the pre-move masks of a position are
+        computed once and shared by every candidate move analyzed from it, and
+        the post-move masks are shared by the discovered and blocked checks.
+        """
+        key = position._transposition_key()
+        masks = self._attack_cache.get(key)
+        if masks is not None:
+            self._attack_cache.move_to_end(key)
+            return masks
+        
+        masks = {square: position.attacks_mask(square) for square in chess.scan_forward(position.occupied)}
+        self._attack_cache[key] = masks
+        if len(self._attack_cache) > self.ATTACK_CACHE_SIZE:
+            self._attack_cache.popitem(last=False)  # Evict least recently used
+        return masks
+
     def _can_piece_attack_along_ray(self, piece_type: chess.PieceType, dx: int, dy: int) -> bool:
         """Helper method to determine if a piece type can attack along a given direction"""
         if piece_type == chess.QUEEN:
-            print(f"QUEEN can attack along {dx}, {dy}")
             return True
         if piece_type == chess.ROOK:
             return dx == 0 or dy == 0
@@ -1,28 +1,88 @@
-from debate_system.protocols import DebateRound
+import re
+from collections import OrderedDict
+from typing import FrozenSet, List, Optional, Tuple, TYPE_CHECKING
+
+from debate_system.protocols import DebateRound, RelationshipNetwork
+
+if TYPE_CHECKING:
+    from piece_agents.base_agent import ChessPieceAgent
+
+
+WORD_PATTERN = re.compile(r"[a-z']+")
+
+
+def _argument_words(argument: str) -> FrozenSet[str]:
+    """Lower-cased words of an argument"""
+    return frozenset(WORD_PATTERN.findall(argument.lower()))
 
 
 class DebateImpact:
     """Tracks how debates affect team dynamics"""
-    
+
+    # Agreement per (argument, other argument) - pieces argue from templates,
+    # so the same pairs come up again across debates
+    AGREEMENT_CACHE_SIZE = 1 << 11
+
+    def __init__(self, relationship_network: Optional[RelationshipNetwork] = None):
+        self.relationship_network = relationship_network or RelationshipNetwork()
+        self._agree_cache: 'OrderedDict[Tuple[str, str], float]' = OrderedDict()
+
     def record_debate_outcome(self, debate: DebateRound):
-        winner = debate.winning_proposal.piece
-        
+        winning_proposal = debate.winning_proposal
+        winner = next(iter(winning_proposal.piece.values()))
+
         # Boost winner's confidence
-        winner.emotional_state.confidence = min(1.0, 
+        winner.emotional_state.confidence = min(1.0,
             winner.emotional_state.confidence * 1.2)
-        
+
         # Impact on other pieces
-        for proposal in debate.proposals:
-            if proposal.piece != winner:
-                # Reduce confidence slightly
-                proposal.piece.emotional_state.confidence *= 0.95
-                
-                # Trust impact based on argument quality
-                agreement = self.calculate_argument_agreement(
-                    winner.argument, proposal.argument)
-                self.update_trust(winner, proposal.piece, agreement)
+        losers = [proposal for proposal in debate.proposals
+                  if next(iter(proposal.piece.values())) is not winner]
+        agreements = self.calculate_argument_agreements(
+            winning_proposal.argument, [proposal.argument for proposal in losers])
+
+        for proposal, agreement in zip(losers, agreements):
+            piece = next(iter(proposal.piece.values()))
+
+            # Reduce confidence slightly
+            piece.emotional_state.confidence *= 0.95
+
+            # Trust impact based on argument quality
+            self.update_trust(winner, piece, agreement)
 
     def calculate_argument_agreement(self, arg1: str, arg2: str) -> float:
-        """Use NLP to determine how much arguments agreed/disagreed"""
-        # This could use sentiment analysis and semantic similarity
-        pass
\ No newline at end of file
+        """Determine how much two arguments agreed, from 0 (not at all) to 1 (fully)"""
+        return self.calculate_argument_agreements(arg1, [arg2])[0]
+
+    def calculate_argument_agreements(self, argument: str, others: List[str]) -> List[float]:
+        """Agreement (0-1) of each of several arguments with one argument
+
+        Agreement is the word overlap (Jaccard similarity) between the
+        arguments. The shared argument is tokenized once for the whole batch,
+        and pairs seen before are answered from the agreement cache.
+        """
+        cache = self._agree_cache
+        words = None
+        agreements = []
+        for other in others:
+            key = (argument, other)
+            agreement = cache.get(key)
+            if agreement is not None:
+                cache.move_to_end(key)
+            else:
+                if words is None:
+                    words = _argument_words(argument)
+                other_words = _argument_words(other)
+                union = len(words | other_words)
+                agreement = len(words & other_words) / union if union else 1.0
+                cache[key] = agreement
+                if len(cache) > self.AGREEMENT_CACHE_SIZE:
+                    cache.popitem(last=False)  # Evict least recently used
+            agreements.append(agreement)
+        return agreements
+
+    def update_trust(self, piece1: 'ChessPieceAgent', piece2: 'ChessPieceAgent', agreement: float):
+        """Move trust between two pieces up for agreement and down for disagreement"""
+        key = (piece1.piece_id, piece2.piece_id)
+        trust = self.relationship_network.trust_matrix.get(key, 0.5)
+        self.relationship_network.trust_matrix[key] = max(0.0, min(1.0, trust + (agreement - 0.5) * 0.2))
@@ -1,7 +1,9 @@
+import bisect
 import chess
-from dataclasses import dataclass
-from typing import Dict, List, Protocol, Optional, TYPE_CHECKING
+from dataclasses import dataclass, replace
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
 from abc import ABC, abstractmethod
+from operator import attrgetter
 from chess_engine.sunfish_wrapper import ChessEngine
 from debate_system.protocols import (
     DebateRound,
@@ -9,7 +11,7 @@ from debate_system.protocols import (
     LLMContext,
     MoveProposal,
     InteractionObserver,
-    PieceInteractionObserver,
+    TeamInteractionObserver,
     Position,
     GameMoment,
     EmotionalState,
@@ -26,35 +28,33 @@ from piece_agents.personality_factory import PersonalityFactory
 from piece_agents.piece_factory import PieceAgentFactory
 
 if TYPE_CHECKING:
-    from chess_engine.sunfish_wrapper import ChessEngine
-    from debate_system.protocols import (
-        DebateRound,
-        LLMConfig,
-        LLMContext,
-        MoveProposal,
-        PieceInteractionObserver,
-        Position,
-        GameMoment,
-        EmotionalState,
-        Interaction,
-        InteractionType,
-        PsychologicalState,
-        GameMemory,
-        RelationshipNetwork,
-        TeamPsychologyObserver
-    )
-    from llm.llm_service import LLMInferenceObserver, LLMService
-    from piece_agents.base_agent import ChessPieceAgent
-    from piece_agents.personality_factory import PersonalityFactory
-    from piece_agents.piece_factory import PieceAgentFactory
+    from debate_system.protocols import PersonalityConfig
 
 
-@dataclass
+# Square index by square name, for reading the from square straight out of a UCI move
+SQUARE_INDEX: Dict[str, chess.Square] = {name: square for square, name in enumerate(chess.SQUARE_NAMES)}
+
+# How an opponent's action is described and how hard it hits the pieces it affects
+OPPONENT_ACTION_EFFECTS: Dict['InteractionType', Tuple[str, float]] = {
+    InteractionType.TRAUMA: ("was captured by", -0.5),        # Major negative impact for captures
+    InteractionType.THREAT: ("is threatened by", -0.3),       # Moderate negative impact for threats
+    InteractionType.STALKING: ("is being stalked by", -0.2),  # Minor negative impact for repeated threats
+    InteractionType.BLOCKADE: ("is blocked by", -0.1),
+    InteractionType.RIVALRY: ("faces rivalry from", -0.1),
+}
+DEFAULT_OPPONENT_ACTION_EFFECT = ("interacts with", -0.1)  # Default negative impact
+
+
+@dataclass(slots=True)
 class AgentMemento:
-    """Captures and restores agent state"""
-    personality_state: Dict
+    """Captures and restores agent state
+    
+    Holds snapshots rather than the agent's live objects, so later changes to
+    the agent don't rewrite saved history.
+    """
+    personality_state: 'PersonalityConfig'
     emotional_state: 'EmotionalState'
-    interaction_history: List['Interaction']
+    interaction_history: Tuple['Interaction', ...]
     timestamp: int
 
 
@@ -62,19 +62,38 @@ class AgentCaretaker:
     """Manages agent state history"""
     def __init__(self):
         self.history: Dict[str, List['AgentMemento']] = {}  # piece_type -> history
+        self.timestamps: Dict[str, List[int]] = {}  # piece_type -> turn of each memento
         
     def save_state(self, piece_type: str, agent: 'ChessPieceAgent', turn: int):
-        """Save agent state at given turn"""
+        """Save agent state at given turn
+        
+        Turns are saved in increasing order, so each history stays sorted by timestamp.
+        """
         if piece_type not in self.history:
             self.history[piece_type] = []
+            self.timestamps[piece_type] = []
+        
+        # Snapshots are immutable once saved, so an unchanged one is shared with
+        # the previous memento instead of copied again
+        emotional_state = agent.emotional_state
+        interaction_history = tuple(agent._recent_interactions)
+        if self.history[piece_type]:
+            previous = self.history[piece_type][-1]
+            if previous.emotional_state == emotional_state:
+                emotional_state = previous.emotional_state
+            if previous.interaction_history == interaction_history:
+                interaction_history = previous.interaction_history
+        if emotional_state is agent.emotional_state:
+            emotional_state = replace(emotional_state)
             
         memento = AgentMemento(
-            personality_state=agent.personality,
-            emotional_state=agent.emotional_state,
-            interaction_history=agent._recent_interactions,
+            personality_state=agent.personality,  # Personalities are fixed for a game
+            emotional_state=emotional_state,
+            interaction_history=interaction_history,
             timestamp=turn
         )
         self.history[piece_type].append(memento)
+        self.timestamps[piece_type].append(turn)
         
     def restore_state(self, piece_type: str, turn: int) -> Optional['AgentMemento']:
         """Restore agent state from specific turn"""
@@ -82,11 +101,8 @@ class AgentCaretaker:
             return None
             
         # Find closest state before or at given turn
-        states = sorted(self.history[piece_type], key=lambda x: x.timestamp)
-        for state in reversed(states):
-            if state.timestamp <= turn:
-                return state
-        return None
+        idx = bisect.bisect_right(self.timestamps[piece_type], turn) - 1
+        return self.history[piece_type][idx] if idx >= 0 else None
 
 
 
@@ -95,22 +111,65 @@ class InteractionMediator:
     """Manages and coordinates piece interactions"""
     def __init__(self):
         self._observers: List['InteractionObserver'] = []
+        # Piece type -> observers subscribed to it; observers registered
+        # without interests are in _observers only and see every event
+        self._by_piece: Dict[str, List['InteractionObserver']] = {}
+        self._interests: Dict[int, FrozenSet[str]] = {}
         self.relationship_network = RelationshipNetwork()
         self.debate_history: List['LLMContext'] = []
         
-    def register(self, observer: 'InteractionObserver'):
-        """Register an observer for interactions"""
+    def register(self, observer: 'InteractionObserver', interests: Optional[Set[str]] = None):
+        """Register an observer for interactions
+        
+        With interests, the observer is only notified of events involving
+        those piece types and is skipped when a batch holds none of them.
+        """
         self._observers.append(observer)
+        if interests is not None:
+            self._interests[id(observer)] = frozenset(interests)
+            for piece_type in interests:
+                self._by_piece.setdefault(piece_type, []).append(observer)
+        
+    def _subscribers(self, piece_types: Iterable[str]) -> Set[int]:
+        """Ids of the interested observers subscribed to any of the piece types"""
+        by_piece = self._by_piece
+        return {id(observer) for piece_type in piece_types
+                for observer in by_piece.get(piece_type, ())}
         
     def notify_moment(self, moment: 'GameMoment'):
         """Notify all observers of a game moment"""
+        self.notify_moments([moment])
+        
+    def notify_moments(self, moments: List['GameMoment']):
+        """Notify observers of a batch of game moments, once per observer"""
+        interests = self._interests
+        subscribers = self._subscribers(
+            piece_type for moment in moments for piece_type in moment.impact)
         for observer in self._observers:
-            observer.on_game_moment(moment)
+            wanted = interests.get(id(observer))
+            if wanted is None:
+                observer.on_game_moments(moments)
+            elif id(observer) in subscribers:
+                observer.on_game_moments(
+                    [moment for moment in moments if not wanted.isdisjoint(moment.impact)])
             
     def notify_relationship(self, piece1: str, piece2: str, change: float):
         """Notify all observers of a relationship change"""
+        self.notify_relationships([(piece1, piece2, change)])
+        
+    def notify_relationships(self, changes: List[Tuple[str, str, float]]):
+        """Notify observers of a batch of relationship changes, once per observer"""
+        interests = self._interests
+        subscribers = self._subscribers(
+            piece for piece1, piece2, _ in changes for piece in (piece1, piece2))
         for observer in self._observers:
-            observer.on_relationship_change(piece1, piece2, change)
+            wanted = interests.get(id(observer))
+            if wanted is None:
+                observer.on_relationship_changes(changes)
+            elif id(observer) in subscribers:
+                observer.on_relationship_changes(
+                    [change for change in changes
+                     if change[0] in wanted or change[1] in wanted])
             
     def notify_debate(self, context: 'LLMContext'):
         """Notify all observers of a debate event"""
@@ -119,14 +178,19 @@ class InteractionMediator:
             
     def register_interaction(self, interaction: 'Interaction'):
         """Record an interaction and update relationships"""
+        trust_change = self._record_interaction(interaction)
+        
+        # Notify observers
+        self.notify_relationship(interaction.piece1, interaction.piece2, trust_change)
+        
+    def _record_interaction(self, interaction: 'Interaction') -> float:
+        """Record an interaction in the relationship network, returning the trust change"""
         self.relationship_network.recent_interactions.append(interaction)
         
         # Update trust matrix
         trust_change = interaction.impact * 0.3
         self.relationship_network.trust_matrix[(interaction.piece1, interaction.piece2)] = trust_change
-        
-        # Notify observers
-        self.notify_relationship(interaction.piece1, interaction.piece2, trust_change)
+        return trust_change
 
     def register_opponent_action(self, position: 'Position', move: str, 
                                affected_pieces: List[str], interaction_type: 'InteractionType',
@@ -140,27 +204,12 @@ class InteractionMediator:
             interaction_type: Type of interaction (THREAT, TRAUMA, etc)
             turn: Current turn number
         """
-        # Determine impact based on interaction type
-        if interaction_type == InteractionType.TRAUMA:
-            impact = -0.5  # Major negative impact for captures
-        elif interaction_type == InteractionType.THREAT:
-            impact = -0.3  # Moderate negative impact for threats
-        elif interaction_type == InteractionType.STALKING:
-            impact = -0.2  # Minor negative impact for repeated threats
-        else:
-            impact = -0.1  # Default negative impact
-            
-        # Create context description based on type
-        context_map = {
-            InteractionType.TRAUMA: "was captured by",
-            InteractionType.THREAT: "is threatened by",
-            InteractionType.STALKING: "is being stalked by",
-            InteractionType.BLOCKADE: "is blocked by",
-            InteractionType.RIVALRY: "faces rivalry from"
-        }
-        action = context_map.get(interaction_type, "interacts with")
+        # Determine context description and impact based on interaction type
+        action, impact = OPPONENT_ACTION_EFFECTS.get(interaction_type, DEFAULT_OPPONENT_ACTION_EFFECT)
         
-        # Record interaction for each affected piece
+        # Record interaction for each affected piece, then notify observers in one batch
+        changes = []
+        moments = []
         for piece_id in affected_pieces:
             interaction = Interaction(
                 piece1=piece_id,
@@ -171,7 +220,8 @@ class InteractionMediator:
                 impact=impact,
                 context=f"{piece_id} {action} enemy piece on {move[2:4]}"
             )
-            self.register_interaction(interaction)
+            trust_change = self._record_interaction(interaction)
+            changes.append((interaction.piece1, interaction.piece2, trust_change))
             
             # Create game moment for significant events
             if interaction_type in [InteractionType.TRAUMA, InteractionType.THREAT]:
@@ -187,7 +237,12 @@ class InteractionMediator:
                     participants=[piece_id],
                     interaction_type = interaction_type
                 )
-                self.notify_moment(moment)
+                moments.append(moment)
+        
+        if changes:
+            self.notify_relationships(changes)
+        if moments:
+            self.notify_moments(moments)
                 
     def register_debate(self, debate_round: 'DebateRound', psychological_state: 'PsychologicalState', game_memory: 'GameMemory'):
         """Initialize a debate interaction between pieces
@@ -213,18 +268,91 @@ class DebateStrategy(ABC):
     """Abstract strategy for conducting debates"""
     def __init__(self, interaction_mediator: Optional['InteractionMediator'] = None):
         self.interaction_mediator = interaction_mediator
+        self._board = chess.Board()  # Reset to each debated position that has no board of its own
     
     @abstractmethod
     def conduct_debate(self, position: 'Position', pieces: Dict[str, 'ChessPieceAgent'],
-                      moves: List[str]) -> 'DebateRound': ...
+                      moves: List[str], board: Optional[chess.Board] = None,
+                      by_square: Optional[Dict[chess.Square, 'ChessPieceAgent']] = None) -> 'DebateRound': ...
+    
+    def _find_piece_agent(self, piece_type: chess.PieceType, from_square: chess.Square,
+                          by_square: Dict[chess.Square, 'ChessPieceAgent']) -> Optional['ChessPieceAgent']:
+        """Find a piece agent by its type and current square.
+        
+        Args:
+            piece_type: Type of piece (e.g., chess.KNIGHT)
+            from_square: Current square of the piece
+            by_square: Piece agents indexed by their current square
+            
+        Returns:
+            The piece agent if found, None otherwise
+        """
+        agent = by_square.get(from_square)
+        if agent and agent.board_piece and agent.board_piece.piece_type == piece_type:
+            return agent
+        return None
+
+    def _parse_moves(self, moves: List[str], board: chess.Board) -> List[Tuple[str, chess.Square, chess.PieceType]]:
+        """Parse moves into (move, from square, piece type) for white pieces in one pass
+        
+        Args:
+            moves: Moves in UCI format (e.g. ['e2e4', 'g1f3'])
+            board: Board at the position the moves are played from
+            
+        Returns:
+            One entry per move whose piece is white; moves from other squares,
+            or without a valid from square, are skipped
+        """
+        white = board.occupied_co[chess.WHITE]
+        parsed = []
+        for move_uci in moves:
+            # Only the from square is needed, so no Move is built
+            from_square = SQUARE_INDEX.get(move_uci[:2])
+            if from_square is None or not white & chess.BB_SQUARES[from_square]:
+                continue
+            parsed.append((move_uci, from_square, board.piece_type_at(from_square)))
+        return parsed
+
+    def _gather_proposals(self, position: 'Position', pieces: Dict[str, 'ChessPieceAgent'],
+                         moves: List[str], board: Optional[chess.Board] = None,
+                         by_square: Optional[Dict[chess.Square, 'ChessPieceAgent']] = None) -> List['MoveProposal']:
+        """Gather move proposals from all pieces that can move
+        
+        Moves are grouped by the agent that will evaluate them, so each agent
+        analyzes all of its moves in one evaluate_moves call. A board already
+        at the position is reused; otherwise the strategy's own board is reset
+        to the FEN.
+        """
+        if board is None or board.fen() != position.fen:
+            board = self._board
+            board.set_fen(position.fen)
+        if by_square is None:
+            by_square = {agent.square: agent for agent in pieces.values() if agent.square is not None}
+        tasks: Dict[str, Tuple['ChessPieceAgent', List[str]]] = {}
+
+        for move_uci, from_square, piece_type in self._parse_moves(moves, board):
+            agent = self._find_piece_agent(piece_type, from_square, by_square)
+            if agent:
+                tasks.setdefault(agent.piece_id, (agent, []))[1].append(move_uci)
+        
+        position_key = board._transposition_key()
+        proposals = [proposal
+                     for agent_id, (agent, agent_moves) in tasks.items()
+                     for proposal in agent.evaluate_moves(position, agent_moves, agent_id,
+                                                          position_key=position_key)
+                     if proposal]
+        proposals.sort(key=attrgetter("score"), reverse=True)
+        return proposals
 
 class LLMDebateStrategy(DebateStrategy):
     """LLM-driven debate implementation"""
     def conduct_debate(self, position: 'Position', pieces: Dict[str, 'ChessPieceAgent'],
-                      moves: List[str], psychological_state: 'PsychologicalState', game_memory: 'GameMemory') -> 'DebateRound':
+                      moves: List[str], psychological_state: 'PsychologicalState', game_memory: 'GameMemory',
+                      board: Optional[chess.Board] = None,
+                      by_square: Optional[Dict[chess.Square, 'ChessPieceAgent']] = None) -> 'DebateRound':
         """Conduct LLM-driven debate process"""
         # Generate rich move proposals with analysis and context
-        proposals = self._gather_proposals(position, pieces, moves)
+        proposals = self._gather_proposals(position, pieces, moves, board, by_square)
         
         # Initialize debate with all our rich context
         debate = DebateRound(
@@ -240,114 +368,15 @@ class LLMDebateStrategy(DebateStrategy):
         )
         
         return debate
-    
-    def _find_piece_agent(self, piece_type: str, square_name: str, pieces: Dict[str, 'ChessPieceAgent']) -> Optional['ChessPieceAgent']:
-        """Find a piece agent by its type and current square.
-        
-        Args:
-            piece_type: Type of piece (e.g., 'N' for knight)
-            square_name: Current square name (e.g., 'f3')
-            pieces: Dictionary of piece agents
-            
-        Returns:
-            The piece agent if found, None otherwise
-        """
-        target_square = chess.parse_square(square_name)
-        
-        # Look for a piece of the right type at the target square
-        for agent in pieces.values():
-            if (agent.board_piece and 
-                agent.board_piece.symbol().upper() == piece_type and 
-                chess.square_name(agent.square) == square_name):
-                return agent
-                
-        return None    
-    
-    def _gather_proposals(self, position: 'Position', pieces: Dict[str, 'ChessPieceAgent'],
-                         moves: List[str]) -> List['MoveProposal']:
-        """Gather move proposals from all pieces that can move"""
-        proposals = []
-        board = chess.Board(position.fen)
-
-        for move_uci in moves:
-            move = chess.Move.from_uci(move_uci)
-            from_square = move.from_square
-
-            piece = board.piece_at(from_square)
-            if not piece or not piece.color == chess.WHITE:
-                print(f"No piece at {from_square}")
-                continue
-                
-            piece_type = piece.symbol().upper()
-            square_name = chess.square_name(from_square)
-            
-            agent = self._find_piece_agent(piece_type, square_name, pieces)
-            agent_id = agent.piece_id
-            if agent:
-                proposal = agent.evaluate_move(position, move_uci, agent_id)
-                if proposal:
-                    proposals.append(proposal)
-        
-        proposals.sort(key=lambda p: p.score, reverse=True)
-        return proposals    
 
 class StandardDebate(DebateStrategy):
     """Standard debate implementation"""
     def conduct_debate(self, position: 'Position', pieces: Dict[str, 'ChessPieceAgent'],
-                      moves: List[str]) -> 'DebateRound':
+                      moves: List[str], board: Optional[chess.Board] = None,
+                      by_square: Optional[Dict[chess.Square, 'ChessPieceAgent']] = None) -> 'DebateRound':
         """Conduct standard debate process"""
-        proposals = self._gather_proposals(position, pieces, moves)
+        proposals = self._gather_proposals(position, pieces, moves, board, by_square)
         return DebateRound(position=position, proposals=proposals)
-        
-    def _find_piece_agent(self, piece_type: str, square_name: str, pieces: Dict[str, 'ChessPieceAgent']) -> Optional['ChessPieceAgent']:
-        """Find a piece agent by its type and current square.
-        
-        Args:
-            piece_type: Type of piece (e.g., 'N' for knight)
-            square_name: Current square name (e.g., 'f3')
-            pieces: Dictionary of piece agents
-            
-        Returns:
-            The piece agent if found, None otherwise
-        """
-        target_square = chess.parse_square(square_name)
-        
-        # Look for a piece of the right type at the target square
-        for agent in pieces.values():
-            if (agent.board_piece and 
-                agent.board_piece.symbol().upper() == piece_type and 
-                chess.square_name(agent.square) == square_name):
-                return agent
-                
-        return None
-
-    def _gather_proposals(self, position: 'Position', pieces: Dict[str, 'ChessPieceAgent'],
-                         moves: List[str]) -> List['MoveProposal']:
-        """Gather move proposals from all pieces that can move"""
-        proposals = []
-        board = chess.Board(position.fen)
-
-        for move_uci in moves:
-            move = chess.Move.from_uci(move_uci)
-            from_square = move.from_square
-
-            piece = board.piece_at(from_square)
-            if not piece or not piece.color == chess.WHITE:
-                print(f"No piece at {from_square}")
-                continue
-                
-            piece_type = piece.symbol().upper()
-            square_name = chess.square_name(from_square)
-            
-            agent = self._find_piece_agent(piece_type, square_name, pieces)
-            agent_id = agent.piece_id
-            if agent:
-                proposal = agent.evaluate_move(position, move_uci, agent_id)
-                if proposal:
-                    proposals.append(proposal)
-        
-        proposals.sort(key=lambda p: p.score, reverse=True)
-        return proposals
 
 
 class DebateCommand:
@@ -359,7 +388,8 @@ class DebateCommand:
     def execute(self, position: 'Position', moves: List[str]) -> 'DebateRound':
         """Execute the debate command"""
         return self.strategy.conduct_debate(
-            position, self.moderator.pieces, moves)
+            position, self.moderator.pieces, moves,
+            board=self.moderator._tracking_board, by_square=self.moderator._by_square)
 
 
 class DebateModerator:
@@ -367,23 +397,28 @@ class DebateModerator:
     
     def __init__(self, pieces: Dict[str, 'ChessPieceAgent'], llm_config: Optional['LLMConfig'] = None):
         self.interaction_mediator = InteractionMediator()
-        self.debate_strategy = StandardDebate()
         self.psychological_state = PsychologicalState()
         self.game_memory = GameMemory()
         self.caretaker = AgentCaretaker()
         self.debate_history: List[DebateRound] = []
         self.debate_strategy = LLMDebateStrategy(self.interaction_mediator) if llm_config else StandardDebate()
 
-        # Initialize pieces
+        # Initialize pieces, indexed by their current square for move lookups
         self.pieces = pieces
+        self._by_square: Dict[chess.Square, 'ChessPieceAgent'] = {
+            agent.square: agent for agent in pieces.values() if agent.square is not None
+        }
         
-        # Create and register observers for each piece
-        for piece in pieces.values():
-            observer = PieceInteractionObserver(
-                piece=piece,
-                relationship_network=self.interaction_mediator.relationship_network
-            )
-            self.interaction_mediator.register(observer)
+        # Board kept in step with the game's move history
+        self._tracking_board = chess.Board()
+        self._last_applied = 0
+        
+        # Create and register one observer for all pieces
+        piece_observer = TeamInteractionObserver(
+            pieces=list(pieces.values()),
+            relationship_network=self.interaction_mediator.relationship_network
+        )
+        self.interaction_mediator.register(piece_observer, interests=piece_observer.interests())
             
         # Register team psychology observer
         team_observer = TeamPsychologyObserver(
@@ -429,8 +464,9 @@ class DebateModerator:
         debate = command.execute(position, moves)
 
         # Save piece states
+        turn = len(self.debate_history)
         for piece_type, piece in self.pieces.items():
-            self.caretaker.save_state(piece_type, piece, len(self.debate_history))
+            self.caretaker.save_state(piece_type, piece, turn)
         
         # Choose winning proposal
         debate = self.choose_winning_proposal(debate)
@@ -452,16 +488,8 @@ class DebateModerator:
             print("No proposals to choose from")
             return None
         
-        if self.debate_strategy == LLMDebateStrategy:
-            # Sort proposals by score (highest first)
-            sorted_proposals = sorted(debate.proposals, key=lambda p: p.score, reverse=True)
-        else:
-            # Sort proposals by score (highest first)
-            sorted_proposals = sorted(debate.proposals, key=lambda p: p.score, reverse=True)
-
-        
-        # Select the highest scoring proposal
-        winning_proposal = sorted_proposals[0]
+        # Proposals are sorted by score, so the first is the highest scoring
+        winning_proposal = debate.proposals[0]
 
         # Update the debate with the winning proposal
         debate.winning_proposal = winning_proposal
@@ -478,6 +506,7 @@ class DebateModerator:
         
         winning_proposal = debate.proposals[choice_idx]
         debate.winning_proposal = winning_proposal
+        debate.summary = None  # The summary names the winner
         
         # Register interaction for winning move
         # Use affected_pieces from the proposal for piece types
@@ -501,42 +530,51 @@ class DebateModerator:
     
     def summarize_debate(self, debate: 'DebateRound') -> str:
         """Generate a summary of the debate round"""
-        summary_parts = []
-        
-        for i, proposal in enumerate(debate.proposals):
-            piece_agent = next(iter(proposal.piece.values()))
-            summary_parts.append(
-                f"{i+1}. {piece_agent.personality.name}'s proposal "
-                f"(score: {proposal.score:.2f}):\n"
-                f"{proposal.argument}\n"
-            )
+        summary_parts = [
+            f"{i+1}. {proposal.display_name}'s proposal "
+            f"(score: {proposal.score:.2f}):\n"
+            f"{proposal.argument}\n"
+            for i, proposal in enumerate(debate.proposals)
+        ]
         
         if debate.winning_proposal:
-            piece_agent = next(iter(debate.winning_proposal.piece.values()))
             summary_parts.append(
-                f"\nWinning move: {piece_agent.personality.name}'s proposal"
+                f"\nWinning move: {debate.winning_proposal.display_name}'s proposal"
             )
         
         return "\n".join(summary_parts)
     
     def get_debate_history(self) -> List[str]:
-        """Get a list of summaries for all past debates"""
-        return [
-            f"Turn {i+1}:\n{self.summarize_debate(debate)}"
-            for i, debate in enumerate(self.debate_history)
-        ] 
+        """Get a list of summaries for all past debates
+        
+        Each debate is summarized once and the summary kept on the debate, so
+        repeated history requests only format the turn headers.
+        """
+        history = []
+        for i, debate in enumerate(self.debate_history):
+            if debate.summary is None:
+                debate.summary = self.summarize_debate(debate)
+            history.append(f"Turn {i+1}:\n{debate.summary}")
+        return history
     
     def update_piece_positions(self, move_history: List[str]):
         """Update piece positions based on move history.
         
+        Only moves added since the last call are applied. If the history no
+        longer extends the one already applied (an undo or a new game), the
+        tracking board is rebuilt from the initial position.
+        
         Args:
             move_history: List of moves in UCI format (e.g. ['e2e4', 'e7e5'])
         """
-        # Start from initial position
-        board = chess.Board()
-        
-        # Replay moves and update piece positions
-        for move_uci in move_history:
+        board = self._tracking_board
+        if (len(move_history) < self._last_applied or
+                (self._last_applied and move_history[self._last_applied - 1] != board.peek().uci())):
+            board = self._tracking_board = chess.Board()
+            self._last_applied = 0
+        
+        # Apply new moves and update piece positions
+        for move_uci in move_history[self._last_applied:]:
             move = chess.Move.from_uci(move_uci)
             
             # Only track white pieces
@@ -546,6 +584,8 @@ class DebateModerator:
                 
             # Make the move on our tracking board
             board.push(move)
+        
+        self._last_applied = len(move_history)
     
     def _update_piece_position(self, piece: chess.Piece, move: chess.Move):
         """Update a piece's position when it moves.
@@ -554,13 +594,10 @@ class DebateModerator:
             piece: The chess piece that moved
             move: The move that was made
         """
-        piece_type = piece.symbol().upper()
-        
         # Find the agent for this piece
-        for agent in self.pieces.values():
-            if (agent.board_piece and 
-                agent.board_piece.symbol().upper() == piece_type and 
-                agent.square == move.from_square):
-                # Update the agent's square to the new position
-                agent.square = move.to_square
-                break 
\ No newline at end of file
+        agent = self._by_square.get(move.from_square)
+        if agent and agent.board_piece and agent.board_piece.piece_type == piece.piece_type:
+            # Update the agent's square to the new position
+            del self._by_square[move.from_square]
+            self._by_square[move.to_square] = agent
+            agent.square = move.to_square
@@ -1,7 +1,11 @@
 """Protocols and data structures for the debate chess system"""
+from collections import deque
 from enum import Enum
+from functools import partial
+from itertools import islice
+from types import MappingProxyType
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Deque, Dict, List, Mapping, Optional, Set, Tuple, Any, Union
 from typing import TYPE_CHECKING
 from typing import Protocol
 
@@ -10,6 +14,10 @@ if TYPE_CHECKING:
     from moderator import DebateModerator
 
 
+# How many recent interactions are kept - older ones drop off
+RECENT_INTERACTIONS_LIMIT = 128
+
+
 class InteractionType(Enum):
     """Types of interactions between pieces"""
     SUPPORT = "support"           # One piece protects/supports another
@@ -36,8 +44,18 @@ class InteractionObserver(Protocol):
     def on_game_moment(self, moment: 'GameMoment'): ...
     def on_relationship_change(self, piece1: str, piece2: str, change: float): ...
     def on_debate_round(self, context: 'LLMContext'): ...
+    
+    def on_game_moments(self, moments: List['GameMoment']):
+        """React to a batch of game moments, in order"""
+        for moment in moments:
+            self.on_game_moment(moment)
+    
+    def on_relationship_changes(self, changes: List[Tuple[str, str, float]]):
+        """React to a batch of (piece1, piece2, change) relationship changes, in order"""
+        for piece1, piece2, change in changes:
+            self.on_relationship_change(piece1, piece2, change)
 
-@dataclass
+@dataclass(slots=True)
 class EngineAnalysis:
     """Analysis results from the engine"""
     depth: int
@@ -47,7 +65,7 @@ class EngineAnalysis:
     time_ms: int
     nps: int       # Nodes per second
 
-@dataclass
+@dataclass(slots=True)
 class Interaction:
     """
     Record of an interaction between pieces
@@ -74,7 +92,7 @@ class Interaction:
     impact: float  # -1.0 to 1.0, negative for negative interactions
     context: str   # Description of what happened
 
-@dataclass
+@dataclass(slots=True)
 class Trigger:
     """
     A position pattern that triggers an emotional response
@@ -101,7 +119,7 @@ class Trigger:
     memory: str                # Description of the associated memory
     turn: int                  # When this trigger was formed
 
-@dataclass
+@dataclass(slots=True)
 class GameMoment:
     """
     A significant moment in the game
@@ -145,7 +163,7 @@ class GameMoment:
         """How significant this moment was (0-1)"""
         return min(1.0, sum(abs(v) for v in self.impact.values()) / len(self.impact))
 
-@dataclass
+@dataclass(slots=True)
 class EmotionalState:
     """Current emotional state of a piece"""
     confidence: float = 0.5   # Affects risk-taking
@@ -155,10 +173,22 @@ class EmotionalState:
     
     def apply_impact(self, impact: Dict[str, float]):
         """Apply emotional impacts while keeping values in [0,1]"""
+        # Each emotion is assigned directly rather than through getattr/setattr
         for emotion, value in impact.items():
-            current = getattr(self, emotion)
-            new_value = max(0.0, min(1.0, current + value))
-            setattr(self, emotion, new_value)
+            if emotion == 'confidence':
+                value += self.confidence
+                self.confidence = 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
+            elif emotion == 'morale':
+                value += self.morale
+                self.morale = 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
+            elif emotion == 'trust':
+                value += self.trust
+                self.trust = 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
+            elif emotion == 'aggression':
+                value += self.aggression
+                self.aggression = 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
+            else:
+                raise ValueError(f"Unknown emotion: {emotion}")
     
     @property
     def cooperation_bonus(self) -> float:
@@ -170,7 +200,7 @@ class EmotionalState:
         """Confidence and aggression affect risk-taking"""
         return (self.confidence * 0.7 + self.aggression * 0.3)
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Chess position representation"""
     fen: str
@@ -179,9 +209,20 @@ class Position:
     @property
     def is_white_to_move(self) -> bool:
         """Determine if white to move based on FEN"""
-        return self.fen.split()[1] == 'w'
+        # The side to move is the character right after the piece placement
+        fen = self.fen
+        return fen[fen.index(' ') + 1] == 'w'
+    
+    @property
+    def key(self) -> str:
+        """Cache key for the position: the FEN without its move counters
+        
+        Positions reached at different points of the game share a key, as
+        long as placement, side to move, castling and en passant match.
+        """
+        return ' '.join(self.fen.split(' ')[:4])
 
-@dataclass
+@dataclass(slots=True)
 class MoveProposal:
     """A proposed move from a piece"""
     piece: Dict[str, 'ChessPieceAgent']
@@ -192,8 +233,29 @@ class MoveProposal:
     interaction_type: Optional[InteractionType] = None
     tactical_context: Dict[str, bool] = field(default_factory=dict)  # captures, checks, etc
     affected_pieces: List[str] = field(default_factory=list)  # pieces involved in the move
-
-@dataclass
+    display_name: str = ''  # personality name of the proposing piece, for summaries
+
+# How the team's psychology responds to each kind of winning move
+INTERACTION_TEAM_IMPACTS: Dict[InteractionType, Dict[str, float]] = {
+    InteractionType.SACRIFICE: {
+        'morale': 0.2,         # Heroic sacrifice boosts morale
+        'cohesion': 0.15,      # Team admires the sacrifice
+    },
+    InteractionType.COMPETITION: {
+        'morale': -0.1,        # Loss of material hurts morale
+        'cohesion': -0.05,     # Some tension from the capture
+    },
+    InteractionType.COOPERATION: {
+        'coordination': 0.15,  # Better tactical coordination
+        'cohesion': 0.1,       # Working together builds trust
+    },
+    InteractionType.SUPPORT: {
+        'morale': 0.05,        # Supporting moves boost spirits
+        'leadership': 0.1,     # Good coordination shows leadership
+    },
+}
+
+@dataclass(slots=True)
 class PsychologicalState:
     """Tracks overall board psychology"""
     cohesion: float = 0.5      # Team unity and coordination
@@ -215,25 +277,9 @@ class PsychologicalState:
         if not proposal:
             return {}
         
-        impacts = {}
-        
         # Base impact on interaction type
-        if proposal.interaction_type == InteractionType.SACRIFICE:
-            impacts['morale'] = 0.2  # Heroic sacrifice boosts morale
-            impacts['cohesion'] = 0.15  # Team admires the sacrifice
-            
-        elif proposal.interaction_type == InteractionType.COMPETITION:
-            impacts['morale'] = -0.1  # Loss of material hurts morale
-            impacts['cohesion'] = -0.05  # Some tension from the capture
-            
-        elif proposal.interaction_type == InteractionType.COOPERATION:
-            impacts['coordination'] = 0.15  # Better tactical coordination
-            impacts['cohesion'] = 0.1  # Working together builds trust
-            
-        elif proposal.interaction_type == InteractionType.SUPPORT:
-            impacts['morale'] = 0.05  # Supporting moves boost spirits
-            impacts['leadership'] = 0.1  # Good coordination shows leadership
-            
+        impacts = dict(INTERACTION_TEAM_IMPACTS.get(proposal.interaction_type, ()))
+        
         # Additional impacts based on tactical context
         if proposal.tactical_context.get('is_check'):
             impacts['confidence'] = 0.1  # Attacking the king boosts confidence
@@ -246,7 +292,7 @@ class PsychologicalState:
             
         return impacts
 
-@dataclass
+@dataclass(slots=True)
 class DebateRound:
     """
     Records a round of debate
@@ -270,8 +316,9 @@ class DebateRound:
             })
     """
     position: Position
-    proposals: List[MoveProposal]
+    proposals: List[MoveProposal]  # Sorted by score, highest first
     winning_proposal: Optional[MoveProposal] = None
+    summary: Optional[str] = field(default=None, repr=False, compare=False)  # cached by the moderator
     
     @property
     def has_consensus(self) -> bool:
@@ -291,7 +338,7 @@ class DebateRound:
         psychological_state.coordination += 0.1
         psychological_state.leadership += 0.05
         
-@dataclass
+@dataclass(slots=True)
 class PersonalityConfig:
     """Configuration for engine personality"""
     name: str
@@ -302,7 +349,7 @@ class PersonalityConfig:
     positional_weight: float = 1.0  # Weight for positional factors
     risk_tolerance: float = 0.5     # 0 = very cautious, 1 = very aggressive
 
-@dataclass
+@dataclass(slots=True)
 class PersonalityTemplate:
     """Template for creating piece personalities"""
     name: str
@@ -313,11 +360,12 @@ class PersonalityTemplate:
     positional_weight: float
     risk_tolerance: float
 
-@dataclass
+@dataclass(slots=True)
 class RelationshipNetwork:
     """Tracks relationships between pieces"""
     trust_matrix: Dict[Tuple[str, str], float] = field(default_factory=dict)  # (piece1, piece2) -> trust level
-    recent_interactions: List[Interaction] = field(default_factory=list)  # Last N interactions
+    recent_interactions: Deque[Interaction] = field(
+        default_factory=lambda: deque(maxlen=RECENT_INTERACTIONS_LIMIT))  # Last N interactions
     
     def get_support_bonus(self, piece1: str, piece2: str) -> float:
         """Calculate bonus for pieces working together"""
@@ -332,7 +380,7 @@ class RelationshipNetwork:
             
         # Look at last N interactions involving these pieces
         relevant = [
-            i for i in self.recent_interactions[-window:]
+            i for i in islice(reversed(self.recent_interactions), window)
             if (i.piece1 == piece1 and i.piece2 == piece2) or
                (i.piece1 == piece2 and i.piece2 == piece1)
         ]
@@ -348,7 +396,7 @@ class RelationshipNetwork:
             
         return sum(i.impact for i in cooperative) / len(cooperative)
 
-@dataclass
+@dataclass(slots=True)
 class PieceInteractionObserver:
     """Observes and tracks interactions for a specific chess piece"""
     piece: 'ChessPieceAgent'
@@ -356,18 +404,32 @@ class PieceInteractionObserver:
     
     def on_game_moment(self, moment: GameMoment):
         """React to a game moment by updating piece emotional state"""
-        # Only react if this piece is involved
+        self.on_game_moments([moment])
+    
+    def on_game_moments(self, moments: List[GameMoment]):
+        """React to a batch of game moments by updating piece emotional state"""
         piece_type = self.piece.personality.name[0].upper()  # Get piece type from name
-        if piece_type in moment.impact:
-            self.piece.emotional_state.apply_impact(moment.impact[piece_type])
+        emotional_state = self.piece.emotional_state
+        for moment in moments:
+            # Only react if this piece is involved
+            if piece_type in moment.impact:
+                emotional_state.apply_impact(moment.impact[piece_type])
             
     def on_relationship_change(self, piece1: str, piece2: str, change: float):
         """React to relationship changes involving this piece"""
+        self.on_relationship_changes([(piece1, piece2, change)])
+    
+    def on_relationship_changes(self, changes: List[Tuple[str, str, float]]):
+        """React to a batch of relationship changes involving this piece"""
         piece_type = self.piece.personality.name[0].upper()
-        if piece1 == piece_type or piece2 == piece_type:
+        emotional_state = self.piece.emotional_state
+        for piece1, piece2, change in changes:
+            if piece1 != piece_type and piece2 != piece_type:
+                continue
+            
             # Update emotional state based on relationship change
             trust_impact = {"trust": change * 0.5}
-            self.piece.emotional_state.apply_impact(trust_impact)
+            emotional_state.apply_impact(trust_impact)
             
             # Get cooperation bonus from relationship network
             other_piece = piece2 if piece1 == piece_type else piece1
@@ -375,7 +437,67 @@ class PieceInteractionObserver:
             
             # Apply cooperation bonus to morale
             if bonus > 0:
-                self.piece.emotional_state.apply_impact({"morale": bonus * 0.3})
+                emotional_state.apply_impact({"morale": bonus * 0.3})
+
+@dataclass(slots=True)
+class TeamInteractionObserver:
+    """Observes and tracks interactions for every piece of a team in one observer
+    
+    Reacts exactly like one PieceInteractionObserver per piece, but each event
+    is dispatched once for the whole team.
+    """
+    pieces: List['ChessPieceAgent']
+    relationship_network: RelationshipNetwork
+    # Pieces grouped by piece type, taken from their personality names
+    _by_type: Dict[str, List['ChessPieceAgent']] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        """Group the pieces by type once - the team doesn't change during a game"""
+        self._by_type = {}
+        for piece in self.pieces:
+            self._by_type.setdefault(piece.personality.name[0].upper(), []).append(piece)
+    
+    def interests(self) -> Set[str]:
+        """Piece types this observer reacts to"""
+        return set(self._by_type)
+    
+    def on_game_moment(self, moment: GameMoment):
+        """React to a game moment by updating piece emotional states"""
+        self.on_game_moments([moment])
+    
+    def on_game_moments(self, moments: List[GameMoment]):
+        """React to a batch of game moments by updating piece emotional states"""
+        by_type = self._by_type
+        for moment in moments:
+            # Only the pieces of the impacted types are visited
+            for piece_type, impact in moment.impact.items():
+                for piece in by_type.get(piece_type, ()):
+                    piece.emotional_state.apply_impact(impact)
+    
+    def on_relationship_change(self, piece1: str, piece2: str, change: float):
+        """React to a relationship change involving any of the pieces"""
+        self.on_relationship_changes([(piece1, piece2, change)])
+    
+    def on_relationship_changes(self, changes: List[Tuple[str, str, float]]):
+        """React to a batch of relationship changes involving any of the pieces"""
+        by_type = self._by_type
+        for piece1, piece2, change in changes:
+            for piece_type, other_piece in ((piece1, piece2), (piece2, piece1)):
+                involved = by_type.get(piece_type)
+                if not involved:
+                    continue
+                
+                # Get cooperation bonus from relationship network
+                bonus = self.relationship_network.get_support_bonus(piece_type, other_piece)
+                for piece in involved:
+                    # Update emotional state based on relationship change
+                    piece.emotional_state.apply_impact({"trust": change * 0.5})
+                    
+                    # Apply cooperation bonus to morale
+                    if bonus > 0:
+                        piece.emotional_state.apply_impact({"morale": bonus * 0.3})
+                if piece1 == piece2:
+                    break
 
 class PersonalityTrait(Enum):
     """Core personality traits that influence behavior and interactions"""
@@ -388,7 +510,7 @@ class PersonalityTrait(Enum):
     ZEALOUS = "zealous"             # Bishop's conversion attempts
     THEATRICAL = "theatrical"       # Queen's drama
 
-@dataclass
+@dataclass(slots=True)
 class InteractionProfile:
     """Defines how a piece tends to interact with others"""
     primary_traits: List[PersonalityTrait]
@@ -396,45 +518,78 @@ class InteractionProfile:
     conflict_style: str     # How they handle disagreements
     leadership_style: str   # How they influence others
 
-@dataclass
+@dataclass(slots=True)
 class GameMemory:
     """Tracks significant game events and their emotional impact"""
     key_moments: List[GameMoment] = field(default_factory=list)
-    narrative_threads: Dict[str, List[str]] = field(default_factory=dict)
     emotional_triggers: Dict[str, List[Trigger]] = field(default_factory=dict)
+    # Narratives per piece, left as callables until something reads them
+    _narrative_threads: Dict[str, List[Union[str, Callable[[], str]]]] = field(
+        default_factory=dict, init=False, repr=False)
+    
+    @property
+    def narrative_threads(self) -> Mapping[str, List[str]]:
+        """Narratives per piece, generating any that haven't been yet
+        
+        The mapping is a read-only view, but its lists are the stored threads,
+        so appending to one still records the narrative.
+        """
+        for thread in self._narrative_threads.values():
+            for i, narrative in enumerate(thread):
+                if callable(narrative):
+                    thread[i] = narrative()  # Memoize the generated narrative
+        return MappingProxyType(self._narrative_threads)
     
     def record_moment(self, position: Position, move: str, 
                      emotional_impact: Dict[str, float]):
         """Record a significant game moment"""
+        turn = len(self.key_moments) + 1
         moment = GameMoment(
             position=position,
             move=move,
             impact=emotional_impact,
-            turn=len(self.key_moments) + 1,
+            turn=turn,
             narrative="",  # Will be generated
             participants=[]  # Will be determined
         )
         self.key_moments.append(moment)
         
-        # Update narrative threads
+        # Update narrative threads - the narrative is only generated when read,
+        # unless a trigger needs it right away
         piece = move[0]  # Get piece type from move
-        if piece not in self.narrative_threads:
-            self.narrative_threads[piece] = []
-        self.narrative_threads[piece].append(
-            self.generate_moment_narrative(moment))
+        narrative = partial(self.generate_moment_narrative, moment)
         
         # Update emotional triggers
         if abs(max(emotional_impact.values())) > 0.2:
+            narrative = narrative()
             if piece not in self.emotional_triggers:
                 self.emotional_triggers[piece] = []
             self.emotional_triggers[piece].append(
                 Trigger(
                     pattern=position.fen,  # Simplified for now
                     impacts=emotional_impact,
-                    memory=self.generate_moment_narrative(moment),
-                    turn=len(self.key_moments)
+                    memory=narrative,
+                    turn=turn
                 )
             )
+        
+        if piece not in self._narrative_threads:
+            self._narrative_threads[piece] = []
+        self._narrative_threads[piece].append(narrative)
+    
+    def get_narrative_thread(self, piece: str, last: Optional[int] = None) -> List[str]:
+        """Get a piece's narratives, generating any that haven't been yet
+        
+        Args:
+            piece: Piece type whose thread to read
+            last: Only read (and generate) this many of the most recent narratives
+        """
+        thread = self._narrative_threads.get(piece, [])
+        start = 0 if last is None else max(0, len(thread) - last)
+        for i in range(start, len(thread)):
+            if callable(thread[i]):
+                thread[i] = thread[i]()  # Memoize the generated narrative
+        return thread[start:]
     
     def generate_moment_narrative(self, moment: GameMoment) -> str:
         """Generate narrative description of a moment"""
@@ -444,28 +599,30 @@ class GameMemory:
     def generate_argument_context(self, piece: str, 
                                 position: Position) -> str:
         """Generate contextual argument based on piece's history"""
-        # Get piece's narrative thread
-        thread = self.narrative_threads.get(piece, [])
+        # Get the latest entry of piece's narrative thread
+        thread = self.get_narrative_thread(piece, last=1)
         
-        # Get relevant triggers
-        triggers = self.emotional_triggers.get(piece, [])
-        active_triggers = [
-            t for t in triggers
-            if t.pattern in position.fen  # Simplified pattern matching
-        ]
+        # Get the most recent relevant trigger - only it makes it into the
+        # context, so older triggers are not matched once one fires
+        fen = position.fen
+        active_trigger = next(
+            (t for t in reversed(self.emotional_triggers.get(piece, ()))
+             if t.pattern in fen),  # Simplified pattern matching
+            None
+        )
         
         # Combine into context
         context = []
         if thread:
             context.append(f"Remembering: {thread[-1]}")
-        if active_triggers:
-            context.append(f"Feeling: {active_triggers[-1].memory}")
+        if active_trigger:
+            context.append(f"Feeling: {active_trigger.memory}")
             
         return " ".join(context) if context else ""
 
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMContext:
     """Context bundle for LLM operations"""
     debate_round: DebateRound
@@ -474,7 +631,7 @@ class LLMContext:
     interaction_type: Optional[InteractionType] = None
     debate_history: Optional[List[DebateRound]] = None
 
-@dataclass
+@dataclass(slots=True)
 class InferenceResult:
     """Result from an LLM inference operation"""
     content: str
@@ -568,7 +725,7 @@ class NarrativeInferenceProtocol(Protocol):
         context: LLMContext
     ) -> InferenceResult: ...
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     """Configuration for LLM operations"""
     model_name: str
@@ -584,7 +741,7 @@ class LLMConfig:
         "narrative": 2
     })
 
-@dataclass
+@dataclass(slots=True)
 class TeamPsychologyObserver:
     """Observes game moments and updates team psychological state"""
     moderator: 'DebateModerator'  # Reference to the moderator that owns the psychological state
@@ -605,9 +762,19 @@ class TeamPsychologyObserver:
             self.moderator.psychological_state.morale = max(0.0, min(1.0, self.moderator.psychological_state.morale - 0.1))
             self.moderator.psychological_state.cohesion = max(0.0, min(1.0, self.moderator.psychological_state.cohesion + 0.1))
             
+    def on_game_moments(self, moments: List[GameMoment]):
+        """React to a batch of game moments, in order"""
+        for moment in moments:
+            self.on_game_moment(moment)
+            
     def on_relationship_change(self, piece1: str, piece2: str, change: float):
         """React to relationship changes by updating team cohesion"""
         # Significant relationship changes affect team cohesion
         if abs(change) > 0.3:
             self.moderator.psychological_state.cohesion = max(0.0, min(1.0, 
-                self.moderator.psychological_state.cohesion + (change * 0.2)))
\ No newline at end of file
+                self.moderator.psychological_state.cohesion + (change * 0.2)))
+    
+    def on_relationship_changes(self, changes: List[Tuple[str, str, float]]):
+        """React to a batch of relationship changes, in order"""
+        for piece1, piece2, change in changes:
+            self.on_relationship_change(piece1, piece2, change)
@@ -1,8 +1,8 @@
 """OpenAI-based LLM service implementation"""
 import json
 import asyncio
+from collections import OrderedDict
 from typing import Dict, Optional, TYPE_CHECKING
-from functools import lru_cache
 import logging
 
 from openai import AsyncOpenAI
@@ -27,13 +27,15 @@ logger = logging.getLogger(__name__)
 class LLMService(LLMServiceProtocol):
     """OpenAI-based LLM service implementation"""
     
+    # Inference results per (prompt, context) key
+    INFERENCE_CACHE_SIZE = 1 << 10
+    
     def __init__(self, config: LLMConfig):
         self.config = config
         self.client = AsyncOpenAI()
         self._token_usage = 0
-        self._cache: Dict[str, InferenceResult] = {}
+        self._cache: 'OrderedDict[str, InferenceResult]' = OrderedDict()
         
-    @lru_cache(maxsize=1000)
     def _get_cache_key(self, prompt: str, context: LLMContext) -> str:
         """Generate a cache key from prompt and relevant context"""
         # Only include stable/relevant context elements in cache key
@@ -91,11 +93,12 @@ class LLMService(LLMServiceProtocol):
     
     async def infer(self, prompt: str, context: LLMContext) -> InferenceResult:
         """Main inference method"""
-        # Check cache if enabled
-        if self.config.cache_enabled:
-            cache_key = self._get_cache_key(prompt, context)
-            if cache_key in self._cache:
-                cached_result = self._cache[cache_key]
+        # Check cache if enabled - the key is built once and reused to store the result
+        cache_key = self._get_cache_key(prompt, context) if self.config.cache_enabled else None
+        if cache_key is not None:
+            cached_result = self._cache.get(cache_key)
+            if cached_result is not None:
+                self._cache.move_to_end(cache_key)
                 cached_result.cached = True
                 return cached_result
         
@@ -104,9 +107,10 @@ class LLMService(LLMServiceProtocol):
             result = self._process_response(response)
             
             # Cache result if enabled
-            if self.config.cache_enabled:
-                cache_key = self._get_cache_key(prompt, context)
+            if cache_key is not None:
                 self._cache[cache_key] = result
+                if len(self._cache) > self.INFERENCE_CACHE_SIZE:
+                    self._cache.popitem(last=False)  # Evict least recently used
             
             return result
             
@@ -128,7 +132,6 @@ class LLMService(LLMServiceProtocol):
     def clear_cache(self) -> None:
         """Clear the inference cache"""
         self._cache.clear()
-        self._get_cache_key.cache_clear()  # Clear the LRU cache
 
 class BatchLLMService(LLMService):
     """Extension of LLMService that supports batched operations"""
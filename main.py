@@ -52,7 +52,7 @@ class DebateChessGame:
     def _get_sunfish_move(self) -> str:
         """Get Sunfish's move for the opponent"""
         # Set up position in Sunfish
-        self.engine.set_position(self.board.fen(), self.move_history)
+        self.engine.set_board(self.board)
         
         # Let Sunfish think for 1 second
         best_move, _ = self.engine.go(movetime=1000)
@@ -132,7 +132,7 @@ class DebateChessGame:
             print("   No direct relationship changes")
             
         # Show recent interactions
-        recent = network.recent_interactions[-3:]  # Show last 3 interactions
+        recent = list(network.recent_interactions)[-3:]  # Show last 3 interactions
         if recent:
             print("\n📜 Recent Interactions:")
             for interaction in recent:
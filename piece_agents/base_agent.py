@@ -1,12 +1,20 @@
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import List, Set, TYPE_CHECKING, Dict, Tuple, Optional
+from typing import Deque, Hashable, List, Set, TYPE_CHECKING, Dict, Tuple, Optional
 import chess
-from debate_system.protocols import InteractionType, Position, MoveProposal, EngineAnalysis, PersonalityConfig, EmotionalState, Interaction
+from debate_system.protocols import InteractionType, Position, MoveProposal, EngineAnalysis, PersonalityConfig, EmotionalState, Interaction, RECENT_INTERACTIONS_LIMIT
 from chess_engine.sunfish_wrapper import ChessEngine, MoveContext
 if TYPE_CHECKING:
     from chess_engine.sunfish_wrapper import ChessEngine, MoveContext
 
 
+# Standard piece values in pawns, indexed by piece type (index 0 is unused)
+BASE_PIECE_VALUES = (0, 1, 3, 3, 5, 9, 0)  # Kings aren't counted in material
+
+# Upper-case piece letters ('P', 'N', ...), indexed by piece type (index 0 is unused)
+PIECE_LETTERS = tuple(symbol and symbol.upper() for symbol in chess.PIECE_SYMBOLS)
+
+
 @dataclass
 class TacticalOpportunity:
     """Represents a tactical opportunity like a fork or discovered attack"""
@@ -26,14 +34,20 @@ class ChessPieceAgent:
     emotional_state: 'EmotionalState'
     board_piece: Optional['chess.Piece'] = None
     square: Optional['chess.Square'] = None
-    _recent_interactions: List['Interaction'] = field(default_factory=list)
+    _recent_interactions: Deque['Interaction'] = field(
+        default_factory=lambda: deque(maxlen=RECENT_INTERACTIONS_LIMIT))
     _tactical_cache: Dict[str, List[TacticalOpportunity]] = field(default_factory=dict)
+    
+    # Engine results per (position key, move). They don't depend on personality or
+    # emotional state, so only the scoring and argument are redone on a hit
+    MOVE_CACHE_SIZE = 1 << 12
+    _move_cache: 'OrderedDict[Tuple[Hashable, str], Tuple[MoveContext, EngineAnalysis]]' = field(default_factory=OrderedDict)
 
     @property
     def piece_id(self) -> str:
         """Get unique identifier for this piece (e.g., 'Ne2')"""
         if self.board_piece and self.square is not None:
-            return f"{self.board_piece.symbol().upper()}{chess.square_name(self.square)}"
+            return f"{PIECE_LETTERS[self.board_piece.piece_type]}{chess.SQUARE_NAMES[self.square]}"
         return self.personality.name[0].upper()  # Fallback to first letter of personality name
 
     #TODO: add post init for fancier engines with more options
@@ -42,66 +56,111 @@ class ChessPieceAgent:
     #     for option, value in self.personality.options.items():
     #         self.engine.set_option(option, value)
     
-    def evaluate_move(self, position: 'Position', move: str, piece_id: str, think_time: int = 500) -> 'MoveProposal':
+    def evaluate_move(self, position: 'Position', move: str, piece_id: str, think_time: int = 500,
+                      position_key: Optional[Hashable] = None) -> 'MoveProposal':
         """Evaluate a potential move
         
         Args:
             position: Current chess position
             move: Move in UCI format (e.g. 'e2e4')
             think_time: Time to think in milliseconds
+            position_key: Transposition key of the position, if the caller has
+                one; Position.key is used otherwise
             
         Returns:
             MoveProposal with evaluation and analysis
         """
-        # Set up position in engine
-        self.engine.set_position(position.fen, position.move_history)
-        
-        # Get move context before making the move
-        context = self.engine.analyze_move_context(move)
-        
-        # Make the move
-        self.engine.make_move(move)
+        return self.evaluate_moves(position, [move], piece_id, think_time, position_key)[0]
+    
+    def evaluate_moves(self, position: 'Position', moves: List[str], piece_id: str, think_time: int = 500,
+                       position_key: Optional[Hashable] = None) -> List[Optional['MoveProposal']]:
+        """Evaluate several potential moves from the same position
         
-        # Analyze the position after the move
-        analyses = self.engine.evaluate_position()
+        Moves missing from the move cache are analyzed together, from a single
+        engine position setup. Each argument is generated while the engine is
+        still on the board after its move.
         
-        if not analyses:
-            print(f"No analyses for move: {move}")
-            return None
+        Args:
+            position: Current chess position
+            moves: Moves in UCI format (e.g. ['e2e4', 'd2d4'])
+            piece_id: Identifier of this piece (e.g. 'Pe2')
+            think_time: Time to think in milliseconds
+            position_key: Transposition key of the position, if the caller has
+                one; Position.key is used otherwise
             
-        # Calculate weighted score based on personality
-        weighted_score = self._calculate_weighted_score(analyses)
-        
-        # Find tactical opportunities
-        opportunities = self._find_tactical_opportunities(position, move)
-        
-        # Determine interaction type and affected pieces
-        interaction_type, affected_pieces = self._analyze_interaction(context, opportunities)
-        
-        # Create tactical context dictionary
-        tactical_context = {
-            'is_capture': context.is_capture,
-            'is_check': context.is_check,
-            'is_castle': context.is_castle,
-            'gives_discovered_attack': context.gives_discovered_attack,
-            'is_promotion': context.is_promotion,
-            'has_fork': any(opp.type == 'fork' for opp in opportunities),
-            'has_discovered_attack': any(opp.type == 'discovered_attack' for opp in opportunities)
-        }
-        
-        # Generate argument based on personality, analysis, and context
-        argument = self._generate_argument(position, move, analyses)
-        
-        return MoveProposal(
-            piece = {piece_id: self},
-            move=move,
-            score=weighted_score,
-            analysis=analyses,
-            argument=argument,
-            interaction_type=interaction_type,
-            tactical_context=tactical_context,
-            affected_pieces=affected_pieces
-        )
+        Returns:
+            One MoveProposal per move, or None where a move couldn't be analyzed
+        """
+        position_key = position.key if position_key is None else position_key
+        cache = self._move_cache
+        analyzed = {}
+        missing = []
+        for move in moves:
+            key = (position_key, move)
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                analyzed[move] = cached
+            else:
+                missing.append(move)
+        
+        if missing:
+            # Set up the position once, and analyze every uncached move from it
+            self.engine.set_position(position.fen, position.move_history)
+            contexts = [self.engine.analyze_move_context(move) for move in missing]
+            for move, context, analyses in zip(missing, contexts, self.engine.evaluate_positions(missing)):
+                analyzed[move] = cache[(position_key, move)] = (context, analyses)
+                if len(cache) > self.MOVE_CACHE_SIZE:
+                    cache.popitem(last=False)  # Evict least recently used
+        
+        evaluations = []
+        for move in moves:
+            context, analyses = analyzed[move]
+            
+            if not analyses:
+                print(f"No analyses for move: {move}")
+                continue
+                
+            # Find tactical opportunities - this leaves the engine on the board
+            # after the move, which personality scoring reads
+            opportunities = self._find_tactical_opportunities(position, move)
+            
+            # Calculate weighted score based on personality
+            weighted_score = self._calculate_weighted_score(analyses)
+            
+            # Generate argument based on personality, analysis, and context
+            argument = self._generate_argument(position, move, analyses)
+            evaluations.append((move, context, analyses, opportunities, weighted_score, argument))
+        
+        proposals = dict.fromkeys(moves)
+        for move, context, analyses, opportunities, weighted_score, argument in evaluations:
+            # Determine interaction type and affected pieces
+            interaction_type, affected_pieces = self._analyze_interaction(context, opportunities)
+            
+            # Create tactical context dictionary
+            tactical_context = {
+                'is_capture': context.is_capture,
+                'is_check': context.is_check,
+                'is_castle': context.is_castle,
+                'gives_discovered_attack': context.gives_discovered_attack,
+                'is_promotion': context.is_promotion,
+                'has_fork': any(opp.type == 'fork' for opp in opportunities),
+                'has_discovered_attack': any(opp.type == 'discovered_attack' for opp in opportunities)
+            }
+            
+            proposals[move] = MoveProposal(
+                piece = {piece_id: self},
+                move=move,
+                score=weighted_score,
+                analysis=analyses,
+                argument=argument,
+                interaction_type=interaction_type,
+                tactical_context=tactical_context,
+                affected_pieces=affected_pieces,
+                display_name=self.personality.name
+            )
+        
+        return [proposals[move] for move in moves]
     
     def _calculate_weighted_score(self, analysis: 'EngineAnalysis') -> float:
         """Calculate weighted score based on personality
@@ -294,16 +353,7 @@ class ChessPieceAgent:
 
     def _get_piece_value(self, piece: chess.Piece) -> float:
         """Get standard piece value with personality-based adjustments"""
-        base_values = {
-            chess.PAWN: 1,
-            chess.KNIGHT: 3,
-            chess.BISHOP: 3,
-            chess.ROOK: 5,
-            chess.QUEEN: 9,
-            chess.KING: 0  # Kings aren't counted in material
-        }
-        
-        value = base_values[piece.piece_type]
+        value = BASE_PIECE_VALUES[piece.piece_type]
         
         # Adjust based on personality
         if hasattr(self, 'emotional_state') and self.emotional_state.aggression > 0.7:
@@ -331,7 +381,7 @@ class ChessPieceAgent:
 
     def _generate_fork_description(self, target_pieces: List[chess.Piece], value: float) -> str:
         """Generate natural language description of a fork opportunity"""
-        piece_names = [p.symbol().upper() for p in target_pieces]
+        piece_names = [PIECE_LETTERS[p.piece_type] for p in target_pieces]
         
         # More excited language if we're feeling confident (if we have emotional state)
         if hasattr(self, 'emotional_state'):
@@ -346,8 +396,8 @@ class ChessPieceAgent:
                                               enemy_piece: chess.Piece,
                                               value: float) -> str:
         """Generate description for a discovered attack opportunity"""
-        our_name = our_piece.symbol().upper()
-        enemy_name = enemy_piece.symbol().upper()
+        our_name = PIECE_LETTERS[our_piece.piece_type]
+        enemy_name = PIECE_LETTERS[enemy_piece.piece_type]
         
         if hasattr(self, 'emotional_state'):
             if self.emotional_state.confidence > 0.7:
@@ -375,30 +425,30 @@ class ChessPieceAgent:
         # Handle captures
         if context.is_capture:
             affected_pieces.append(context.captured_piece_type)
-            return 'InteractionType.COMPETITION', affected_pieces
+            return InteractionType.COMPETITION, affected_pieces
         
         # Is it a sacrifice?
         if context.is_blocking or context.gives_discovered_attack or context.is_check:
-            return 'InteractionType.SACRIFICE', affected_pieces        
+            return InteractionType.SACRIFICE, affected_pieces        
             
         # Handle castling (cooperation between king and rook)
         if context.is_castle:
             affected_pieces.append('R')  # Rook is involved
-            return 'InteractionType.COOPERATION', affected_pieces
+            return InteractionType.COOPERATION, affected_pieces
             
         # Handle discovered attacks and forks (usually cooperative tactics)
         if opportunities:
             for opp in opportunities:
-                affected_pieces.extend(p.symbol().upper() for p in opp.target_pieces)
+                affected_pieces.extend(PIECE_LETTERS[p.piece_type] for p in opp.target_pieces)
             if any(opp.type == 'discovered_attack' for opp in opportunities):
-                return 'InteractionType.COOPERATION', list(set(affected_pieces))
+                return InteractionType.COOPERATION, list(set(affected_pieces))
             if any(opp.type == 'fork' for opp in opportunities):
-                return 'InteractionType.COMPETITION', list(set(affected_pieces))
+                return InteractionType.COMPETITION, list(set(affected_pieces))
             
         # Handle promotions (pawn achieving greatness)
         if context.is_promotion:
             affected_pieces.append(context.promotion_piece_type.upper())
-            return 'InteractionType.SUPPORT', list(set(affected_pieces))
+            return InteractionType.SUPPORT, list(set(affected_pieces))
             
         # Default to support (basic developing/positioning moves)
-        return 'InteractionType.SUPPORT', list(set(affected_pieces))
\ No newline at end of file
+        return InteractionType.SUPPORT, list(set(affected_pieces))
\ No newline at end of file
@@ -4,7 +4,7 @@ import chess
 
 from chess_engine.sunfish_wrapper import ChessEngine
 from debate_system.protocols import PersonalityConfig
-from .base_agent import ChessPieceAgent
+from .base_agent import PIECE_LETTERS, ChessPieceAgent
 from .knight import KnightAgent
 from .bishop import BishopAgent
 from .rook import RookAgent
@@ -67,8 +67,8 @@ class PieceAgentFactory:
         # Create agents for each white piece
         for square, piece in piece_map.items():
             if piece.color == chess.WHITE:
-                piece_type = piece.symbol().upper()
-                square_name = chess.square_name(square)
+                piece_type = PIECE_LETTERS[piece.piece_type]
+                square_name = chess.SQUARE_NAMES[square]
                 piece_id = f"{piece_type}{square_name}"
                 
                 # Get personality for this piece type
@@ -78,7 +78,7 @@ class PieceAgentFactory:
                 agents[piece_id] = cls.create_agent(
                     piece_type=piece_type,
                     personality=personality,
-                    engine=ChessEngine(),  # Fresh engine per piece
+                    engine=ChessEngine(board),  # Fresh engine per piece, copied from the parsed board
                     board_piece=piece,
                     square=square
                 )
@@ -2,7 +2,7 @@ import pytest
 import chess
 from chess_engine.sunfish_wrapper import ChessEngine, EngineAnalysis
 from piece_agents.base_agent import ChessPieceAgent, TacticalOpportunity
-from debate_system.protocols import EmotionalState, PersonalityConfig, Position
+from debate_system.protocols import EmotionalState, InteractionType, PersonalityConfig, Position
 
 @pytest.fixture
 def engine():
@@ -150,3 +150,36 @@ def test_tactic_confidence_calculation(base_agent):
     
     confidence = base_agent._calculate_tactic_confidence(knight_square, target_squares)
     assert 0 <= confidence <= 1
+
+def test_capture_is_a_competition(base_agent):
+    """Test that interactions are reported as InteractionType members"""
+    base_agent.engine.set_position("4k3/8/8/3p4/4P3/8/8/4K3 w - - 0 1")
+    context = base_agent.engine.analyze_move_context("e4d5")
+    
+    interaction_type, affected_pieces = base_agent._analyze_interaction(context, [])
+    assert interaction_type is InteractionType.COMPETITION
+    assert affected_pieces == ['P', 'p']
+
+def test_apply_impact_clamps_emotions():
+    """Test that emotional impacts stay within [0, 1] and reject unknown emotions"""
+    state = EmotionalState()
+    state.apply_impact({"confidence": 0.8, "morale": -0.7, "trust": 0.1})
+    
+    assert state.confidence == 1.0
+    assert state.morale == 0.0
+    assert state.trust == pytest.approx(0.6)
+    assert state.aggression == 0.5
+    
+    with pytest.raises(ValueError):
+        state.apply_impact({"courage": 0.1})
+
+def test_arguments_see_the_board_after_the_move(engine, default_personality):
+    """Test that arguments are generated with the engine on the post-move board"""
+    class BoardReadingAgent(ChessPieceAgent):
+        def _generate_argument(self, position, move, analysis):
+            return str(self.engine.get_piece_at(chess.parse_square(move[2:4])))
+    
+    position = Position(fen=chess.STARTING_FEN, move_history=[])
+    reader = BoardReadingAgent(engine=engine, personality=default_personality, emotional_state=EmotionalState())
+    
+    assert [p.argument for p in reader.evaluate_moves(position, ["e2e4", "g1f3"], "P")] == ["P", "N"]
@@ -0,0 +1,94 @@
+import pytest
+import chess
+from chess_engine.sunfish_wrapper import ChessEngine
+from debate_system.debate_impact import DebateImpact
+from debate_system.protocols import (
+    DebateRound, EmotionalState, MoveProposal, PersonalityConfig, Position
+)
+from piece_agents.base_agent import ChessPieceAgent
+
+@pytest.fixture
+def impact():
+    """Create a fresh debate impact tracker for each test"""
+    return DebateImpact()
+
+def make_agent(piece_type: chess.PieceType, square: chess.Square) -> ChessPieceAgent:
+    """Create a white piece agent on the given square"""
+    personality = PersonalityConfig(
+        name="default",
+        description="Default personality",
+        options={}
+    )
+    return ChessPieceAgent(
+        engine=ChessEngine(),
+        personality=personality,
+        emotional_state=EmotionalState(),
+        board_piece=chess.Piece(piece_type, chess.WHITE),
+        square=square
+    )
+
+def make_proposal(agent: ChessPieceAgent, move: str, score: float, argument: str) -> MoveProposal:
+    """Create a proposal from an agent"""
+    return MoveProposal(
+        piece={agent.piece_id: agent},
+        move=move,
+        score=score,
+        analysis=None,
+        argument=argument
+    )
+
+def test_argument_agreement_is_word_overlap(impact):
+    """Test that agreement is the Jaccard similarity of the arguments' words"""
+    assert impact.calculate_argument_agreement("Control the center", "control the CENTER") == 1.0
+    assert impact.calculate_argument_agreement("a b c", "b c d") == 0.5
+    assert impact.calculate_argument_agreement("attack now", "defend later") == 0.0
+
+def test_empty_arguments_fully_agree(impact):
+    """Test that two arguments without words count as full agreement"""
+    assert impact.calculate_argument_agreement("", "") == 1.0
+    assert impact.calculate_argument_agreement("!!!", "") == 1.0
+
+def test_batch_agreements_match_pairs(impact):
+    """Test that batched agreements match one call per pair"""
+    argument = "push the pawn to open the file"
+    others = ["open the file", "castle now", "push the pawn", argument]
+
+    batched = impact.calculate_argument_agreements(argument, others)
+
+    assert batched == [DebateImpact().calculate_argument_agreement(argument, other) for other in others]
+
+def test_agreement_cache_evicts_least_recently_used(impact):
+    """Test that the agreement cache keeps only the most recently used pairs"""
+    impact.AGREEMENT_CACHE_SIZE = 2
+    impact.calculate_argument_agreements("x", ["a", "b"])
+    impact.calculate_argument_agreement("x", "a")  # Hit - "a" becomes most recent
+    impact.calculate_argument_agreement("x", "c")
+
+    assert list(impact._agree_cache) == [("x", "a"), ("x", "c")]
+
+def test_record_debate_outcome(impact):
+    """Test confidence and trust changes after a debate"""
+    winner = make_agent(chess.KNIGHT, chess.G1)
+    ally = make_agent(chess.BISHOP, chess.F1)
+    rival = make_agent(chess.QUEEN, chess.D1)
+    proposals = [
+        make_proposal(winner, "g1f3", 1.0, "develop the knight toward the center"),
+        make_proposal(ally, "f1c4", 0.8, "develop the knight toward the center"),
+        make_proposal(rival, "d1h5", 0.5, "attack f7 immediately"),
+    ]
+    debate = DebateRound(
+        position=Position(fen=chess.STARTING_FEN, move_history=[]),
+        proposals=proposals,
+        winning_proposal=proposals[0]
+    )
+
+    impact.record_debate_outcome(debate)
+
+    assert winner.emotional_state.confidence == pytest.approx(0.6)
+    assert ally.emotional_state.confidence == pytest.approx(0.475)
+    assert rival.emotional_state.confidence == pytest.approx(0.475)
+
+    trust = impact.relationship_network.trust_matrix
+    assert trust[("Ng1", "Bf1")] == pytest.approx(0.6)  # Full agreement raises trust
+    assert trust[("Ng1", "Qd1")] == pytest.approx(0.4)  # No agreement lowers it
+    assert ("Ng1", "Ng1") not in trust
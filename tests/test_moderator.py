@@ -295,4 +295,124 @@ def test_emotional_state_influence(default_moderator, starting_position):
         "daring" in p.argument.lower() or
         "noble" in p.argument.lower()
         for p in knight_proposals
-    ) 
\ No newline at end of file
+    ) 
+
+def test_update_piece_positions_is_incremental(default_moderator):
+    """Test that only new moves are applied to the tracking board"""
+    default_moderator.update_piece_positions(["e2e4", "e7e5"])
+    tracking_board = default_moderator._tracking_board
+    
+    default_moderator.update_piece_positions(["e2e4", "e7e5", "g1f3"])
+    
+    # Same board object, advanced by the one new move
+    assert default_moderator._tracking_board is tracking_board
+    assert len(tracking_board.move_stack) == 3
+    assert default_moderator.pieces['Ng1'].square == chess.F3
+    assert default_moderator.pieces['Pe2'].square == chess.E4
+
+def test_square_index_follows_moves(default_moderator):
+    """Test that the square index tracks agents as they move"""
+    knight = default_moderator.pieces['Ng1']
+    default_moderator.update_piece_positions(["g1f3"])
+    
+    assert default_moderator._by_square.get(chess.G1) is None
+    assert default_moderator._by_square[chess.F3] is knight
+
+def test_move_evaluations_are_cached(default_moderator, starting_position):
+    """Test that re-debating a position reuses the agents' engine results"""
+    first = default_moderator.conduct_debate(starting_position, ["g1f3"])
+    knight = default_moderator.pieces['Ng1']
+    assert len(knight._move_cache) == 1
+    
+    second = default_moderator.conduct_debate(starting_position, ["g1f3"])
+    
+    assert len(knight._move_cache) == 1
+    assert second.proposals[0].analysis is first.proposals[0].analysis
+
+def test_restore_state_finds_latest_memento(default_moderator):
+    """Test restoring the closest saved state at or before a turn"""
+    caretaker = default_moderator.caretaker
+    knight = default_moderator.pieces['Nb1']
+    for turn in (0, 2, 5):
+        caretaker.save_state('Nb1', knight, turn)
+    
+    assert caretaker.restore_state('Nb1', 4).timestamp == 2
+    assert caretaker.restore_state('Nb1', 5).timestamp == 5
+    assert caretaker.restore_state('Nb1', 9).timestamp == 5
+    assert caretaker.restore_state('Nb1', -1) is None
+    assert caretaker.restore_state('Qd1', 3) is None
+
+def test_saved_state_is_a_snapshot(default_moderator):
+    """Test that mementos don't change when the agent does"""
+    caretaker = default_moderator.caretaker
+    knight = default_moderator.pieces['Nb1']
+    confidence = knight.emotional_state.confidence
+    caretaker.save_state('Nb1', knight, 0)
+    caretaker.save_state('Nb1', knight, 1)
+    
+    knight.emotional_state.apply_impact({"confidence": -0.2})
+    
+    memento = caretaker.restore_state('Nb1', 1)
+    assert memento.emotional_state.confidence == confidence
+    assert memento.emotional_state is caretaker.restore_state('Nb1', 0).emotional_state
+
+def test_observers_only_see_their_interests():
+    """Test that observers registered with interests skip unrelated events"""
+    from debate_system.moderator import InteractionMediator
+    
+    class Recorder:
+        def __init__(self):
+            self.moments = []
+            self.changes = []
+        def on_game_moments(self, moments):
+            self.moments.append(moments)
+        def on_relationship_changes(self, changes):
+            self.changes.append(changes)
+    
+    mediator = InteractionMediator()
+    knight_watcher, everything = Recorder(), Recorder()
+    mediator.register(knight_watcher, interests={'N'})
+    mediator.register(everything)
+    
+    mediator.notify_relationships([('B', 'Q', 0.1)])
+    mediator.notify_relationships([('N', 'B', 0.2), ('B', 'Q', 0.1)])
+    
+    assert knight_watcher.changes == [[('N', 'B', 0.2)]]
+    assert len(everything.changes) == 2
+
+def test_position_key_ignores_move_counters():
+    """Test that positions differing only in move counters share a key"""
+    early = Position(fen="4k3/8/8/8/8/8/8/4K2R w K - 0 1", move_history=[])
+    late = Position(fen="4k3/8/8/8/8/8/8/4K2R w K - 12 40", move_history=[])
+    moved = Position(fen="4k3/8/8/8/8/8/8/4K2R b K - 0 1", move_history=[])
+    no_counters = Position(fen="4k3/8/8/8/8/8/8/4K2R w K -", move_history=[])
+    
+    assert early.key == late.key == no_counters.key
+    assert early.key != moved.key
+
+def test_narrative_threads_read_as_strings():
+    """Test that lazily generated narratives are exposed as plain strings"""
+    from debate_system.protocols import GameMemory
+    
+    memory = GameMemory()
+    position = Position(fen=chess.STARTING_FEN, move_history=[])
+    memory.record_moment(position, "Ng1f3", {"morale": 0.1})
+    memory.record_moment(position, "Nf3e5", {"morale": 0.1})
+    
+    assert memory.narrative_threads == {
+        "N": ["Turn 1: Move Ng1f3 played", "Turn 2: Move Nf3e5 played"]
+    }
+    
+    memory.narrative_threads["N"].append("Turn 3: Knight retreats")
+    assert memory.get_narrative_thread("N", last=1) == ["Turn 3: Knight retreats"]
+    with pytest.raises(TypeError):
+        memory.narrative_threads["B"] = []
+
+def test_parse_moves_skips_unusable_moves():
+    """Test that moves from black pieces or without a valid from square are skipped"""
+    from debate_system.moderator import StandardDebate
+    
+    board = chess.Board()
+    parsed = StandardDebate()._parse_moves(["g1f3", "e7e5", "z9a1", "e", ""], board)
+    
+    assert parsed == [("g1f3", chess.G1, chess.KNIGHT)]
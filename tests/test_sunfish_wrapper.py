@@ -1,5 +1,6 @@
 import pytest
 import chess
+from dataclasses import FrozenInstanceError
 from chess_engine.sunfish_wrapper import ChessEngine, EngineAnalysis
 
 @pytest.fixture
@@ -194,4 +195,106 @@ def test_discovered_attacks(engine):
     
     # Test 10: No discovered attack on empty square
     engine.set_position(fen="8/8/8/8/8/4P3/4R3/K7 w - - 0 1")
-    assert engine._check_discovered_attacks(engine._board, chess.Move.from_uci("e3e4")) == False
\ No newline at end of file
+    assert engine._check_discovered_attacks(engine._board, chess.Move.from_uci("e3e4")) == False
+
+
+def test_evaluation_cache(engine):
+    """Test that repeated positions are served from the transposition table"""
+    engine.set_position(fen="r1bqk1nr/pppp1ppp/2n5/2b1p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 0 1")
+    first = engine.evaluate_position()
+    assert engine.evaluate_position() is first
+    
+    # Reaching the same position through a different engine hits the shared cache
+    other = ChessEngine()
+    other.set_position(fen="r1bqk1nr/pppp1ppp/2n5/2b1p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 0 1")
+    assert other.evaluate_position() is first
+    
+    # Shared results are immutable
+    with pytest.raises(FrozenInstanceError):
+        first.score = 0
+    
+    # Same placement with different castling rights is a different position
+    engine.set_position(fen="r1bqk1nr/pppp1ppp/2n5/2b1p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w kq - 0 1")
+    assert engine.evaluate_position() is not first
+
+def test_passed_pawns(engine):
+    """Test passed pawn detection looks ahead on the pawn's own and adjacent files"""
+    # Lone pawn on e4 is passed: +50 passed bonus, +20 for advancing two ranks
+    engine.set_position(fen="4k3/8/8/8/4P3/8/8/4K3 w - - 0 1")
+    assert engine.evaluate_position().positional_score == pytest.approx(0.7)
+    
+    # Black e6 pawn stops both d4 and e4; white pawns stop e6 in return
+    engine.set_position(fen="4k3/8/4p3/8/3PP3/8/8/4K3 w - - 0 1")
+    assert engine.evaluate_position().positional_score == pytest.approx(0.3)
+
+def test_evaluate_positions(engine):
+    """Test batch evaluation of candidate moves"""
+    engine.set_position()
+    moves = ["e2e4", "g1f3", "a2a3"]
+    analyses = engine.evaluate_positions(moves)
+    
+    assert len(analyses) == 3
+    assert engine._board.fen() == chess.STARTING_FEN  # Board is restored
+    
+    # Each result matches evaluating the move on its own
+    for move, analysis in zip(moves, analyses):
+        engine.make_move(move)
+        assert engine.evaluate_position().score == analysis.score
+        engine.set_position()
+
+def test_incremental_material(engine):
+    """Test material balance is tracked through captures, en passant and promotion"""
+    engine.set_position(fen="r3k3/1P6/8/3pP3/8/8/8/4K3 w - d6 0 1")
+    assert engine.evaluate_position().material_balance == pytest.approx(-4.0)
+    
+    engine.make_move("e5d6")  # En passant capture
+    assert engine.evaluate_position().material_balance == pytest.approx(-3.0)
+    
+    engine.make_move("a8a7")
+    engine.make_move("b7b8n")  # Promotion
+    assert engine.evaluate_position().material_balance == pytest.approx(-0.8)
+    
+    engine.make_move("a7b7")
+    engine.make_move("e1e2")
+    engine.make_move("b7b8")  # Capture
+    assert engine.evaluate_position().material_balance == pytest.approx(-4.0)
+
+def test_quiescence_search(engine):
+    """Test that a deeper evaluation resolves a hanging piece"""
+    # White's queen on e4 can be taken by the d5 pawn
+    engine.set_position(fen="4k3/8/8/3p4/4Q3/8/8/4K3 b - - 0 1")
+    static = engine.evaluate_position()
+    assert static.score > 5
+    
+    deep = engine.evaluate_position(quiescence_depth=2)
+    assert deep.score < 0
+    assert deep.depth == 3
+    assert deep.material_balance == static.material_balance  # Components stay static
+    assert engine._board.fen() == "4k3/8/8/3p4/4Q3/8/8/4K3 b - - 0 1"  # Board is restored
+
+def test_set_board(engine):
+    """Test setting the position from a board and from a repeated FEN"""
+    board = chess.Board()
+    board.push_uci("e2e4")
+    engine.set_board(board)
+    assert engine._board.fen() == board.fen()
+    
+    # Moves made by the engine don't touch the caller's board
+    engine.make_move("e7e5")
+    assert board.fen() != engine._board.fen()
+    assert len(board.move_stack) == 1
+    
+    # A FEN seen before is copied from the parsed board, not shared with it
+    fen = engine._board.fen()
+    engine.set_position(fen)
+    engine.make_move("g1f3")
+    engine.set_position(fen)
+    assert engine._board.fen() == fen
+
+def test_engine_from_board():
+    """Test creating an engine from an existing board"""
+    board = chess.Board("4k3/8/8/8/8/8/8/3QK3 w - - 0 1")
+    engine = ChessEngine(board)
+    assert engine._board.fen() == board.fen()
+    assert engine._board is not board
+    assert engine.evaluate_position().material_balance == pytest.approx(9.0)